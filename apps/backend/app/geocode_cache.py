@@ -0,0 +1,37 @@
+"""지오코딩 결과 캐시
+
+사용자가 입력한 검색어(원문) -> 좌표를 최근 사용 순(LRU)으로 보관합니다.
+자동완성 인덱스(SuggestIndex)와 분리되어 있어 오타나 임의의 검색어가
+다른 사용자에게 제안으로 노출되지 않습니다.
+"""
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+class GeocodeCache:
+    """검색어 -> (위도, 경도) LRU 캐시 (max_entries=0이면 캐시하지 않음)"""
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, query: str) -> Optional[Tuple[float, float]]:
+        with self._lock:
+            coords = self._entries.get(query)
+            if coords is not None:
+                self._entries.move_to_end(query)
+            return coords
+
+    def put(self, query: str, latitude: float, longitude: float) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[query] = (latitude, longitude)
+            self._entries.move_to_end(query)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
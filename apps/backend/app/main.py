@@ -1,10 +1,19 @@
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Query, HTTPException, Header, Response
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
+import numpy as np
 import pandas as pd
 import requests
 import os
+import hashlib
+import threading
+import logging
 from typing import List, Optional
 from pydantic import BaseModel
+from app.suggest import SuggestIndex
+from app.geocode_cache import GeocodeCache
+from app.workpool import AdmissionPool, PoolOverloaded
+from app.tiles import TILE_ZOOM, MAX_BBOX_TILES, TileIndex, bbox_tile_count
 
 app = FastAPI()
 
@@ -22,6 +31,26 @@ class School(BaseModel):
     performance_score: float
     rank: int
 
+class Suggestion(BaseModel):
+    name: str
+    latitude: float
+    longitude: float
+
+class SuggestResponse(BaseModel):
+    query: str
+    suggestions: List[Suggestion]
+
+class MapSchool(BaseModel):
+    학교명: str
+    latitude: float
+    longitude: float
+    performance_score: float
+
+class BBoxResponse(BaseModel):
+    snapshot: str
+    bbox: dict
+    schools: List[MapSchool]
+
 class SearchResponse(BaseModel):
     apartment: str
     coordinates: dict
@@ -32,38 +61,76 @@ class SearchResponse(BaseModel):
 
 # Kakao API 키 (환경변수에서 가져오기)
 KAKAO_KEY = os.getenv("KAKAO_REST_API_KEY", "your-kakao-api-key")
+# Kakao 키워드 검색 API 주소 (부하 테스트 시 로컬 stub 서버로 교체 가능)
+KAKAO_API_URL = os.getenv("KAKAO_API_URL", "https://dapi.kakao.com/v2/local/search/keyword.json")
+
+# 자동완성 인덱스: 카카오가 아파트로 분류한 장소명(place_name)만 저장
+suggest_index = SuggestIndex()
+# 검색어 원문 -> 좌표 캐시 (GEOCODE_CACHE_SIZE=0이면 매번 카카오 API 호출)
+geocode_cache = GeocodeCache(int(os.getenv("GEOCODE_CACHE_SIZE", "10000")))
+# 카카오 category_name 예: "부동산 > 주거시설 > 아파트"
+APARTMENT_CATEGORY = "아파트"
+
+# 검색 CPU 작업(데이터 로드, 거리 계산, 정렬, 응답 생성)용 워커 풀
+# 실행 중 SEARCH_WORKERS개 + 대기 SEARCH_MAX_QUEUE개를 넘는 CPU 작업은 503으로 거절
+# 지오코딩(I/O) 대기를 포함해 처리 중인 요청은 별도로 SEARCH_MAX_INFLIGHT개까지 허용
+SEARCH_WORKERS = int(os.getenv("SEARCH_WORKERS", str(os.cpu_count() or 1)))
+# 검색 1건의 CPU 작업은 수 ms이므로 워커당 32개 대기는 대기시간 약 0.2초 이내
+SEARCH_MAX_QUEUE = int(os.getenv("SEARCH_MAX_QUEUE", str(SEARCH_WORKERS * 32)))
+SEARCH_MAX_INFLIGHT = int(os.getenv("SEARCH_MAX_INFLIGHT", "256"))
+search_pool = AdmissionPool(SEARCH_WORKERS, SEARCH_MAX_QUEUE, SEARCH_MAX_INFLIGHT)
+
+@app.on_event("shutdown")
+def shutdown_search_pool():
+    search_pool.shutdown()
+
+def haversine(lat1, lon1, lat2, lon2):
+    """두 좌표 간 거리 계산 (Haversine 공식, km)
 
-def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """두 좌표 간 거리 계산 (Haversine 공식)"""
-    from math import radians, cos, sin, asin, sqrt
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
+    lat2/lon2에 배열(Series)을 넘기면 모든 학교와의 거리를 한 번에
+    계산합니다 (행마다 파이썬 함수를 호출하지 않아 GIL 점유 시간이 짧음).
+    """
+    lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
     dlat = lat2 - lat1
     dlon = lon2 - lon1
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    c = 2 * asin(sqrt(a))
+    a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
+    c = 2 * np.arcsin(np.sqrt(a))
     return 6371 * c
 
 def geocode_address(query: str) -> Optional[tuple]:
-    """아파트명으로 좌표 얻기"""
+    """아파트명으로 좌표 얻기 (이미 찾은 검색어는 캐시에서 반환)"""
+    query = query.strip()
+    cached = geocode_cache.get(query)
+    if cached:
+        return cached
+
     headers = {"Authorization": f"KakaoAK {KAKAO_KEY}"}
     params = {"query": query, "size": 1}
     
     try:
-        res = requests.get("https://dapi.kakao.com/v2/local/search/keyword.json", 
-                          headers=headers, params=params)
+        res = requests.get(KAKAO_API_URL, headers=headers, params=params)
         res.raise_for_status()
         docs = res.json().get("documents", [])
         if not docs:
             return None
         p = docs[0]
-        return float(p.get("y")), float(p.get("x"))  # latitude, longitude
+        lat, lon = float(p.get("y")), float(p.get("x"))  # latitude, longitude
+        geocode_cache.put(query, lat, lon)
+        if p.get("place_name") and APARTMENT_CATEGORY in (p.get("category_name") or ""):
+            suggest_index.add(p["place_name"], lat, lon)
+        return lat, lon
     except Exception:
         return None
 
+logger = logging.getLogger(__name__)
+
+# 학교 데이터 CSV 경로 (상대 경로는 서버 실행 디렉토리 기준)
+SCHOOL_DATA_PATH = os.getenv("SCHOOL_DATA_PATH", "middle_schools.csv")
+
 def load_school_data() -> pd.DataFrame:
-    """학교 데이터 로드"""
+    """학교 데이터 로드 (파일을 읽지 못하면 경고 후 3개짜리 샘플 데이터)"""
     try:
-        df = pd.read_csv("middle_schools.csv", encoding='utf-8-sig')
+        df = pd.read_csv(SCHOOL_DATA_PATH, encoding='utf-8-sig')
         df = df.rename(columns={
             '학업성취도': 'performance_score',
             'X좌표(경도)': 'longitude',
@@ -73,36 +140,157 @@ def load_school_data() -> pd.DataFrame:
         df['longitude'] = pd.to_numeric(df['longitude'], errors='coerce')
         df['performance_score'] = pd.to_numeric(df['performance_score'], errors='coerce')
         return df.dropna(subset=['latitude', 'longitude', 'performance_score'])
-    except Exception:
+    except Exception as err:
         # 샘플 데이터 반환
-        return pd.DataFrame({
+        logger.warning("Cannot load school data from %s (%r); serving 3-school sample data",
+                       os.path.abspath(SCHOOL_DATA_PATH), err)
+        sample = pd.DataFrame({
             '학교명': ['샘플중학교1', '샘플중학교2', '샘플중학교3'],
             'latitude': [37.5665, 37.5666, 37.5667],
             'longitude': [126.9780, 126.9781, 126.9782],
             'performance_score': [85.5, 82.3, 78.9]
         })
+        sample.attrs['sample'] = True
+        return sample
+
+# 검색용 학교 데이터: 요청마다 CSV를 읽지 않고, 파일이 바뀔 때만 다시 로드
+_school_lock = threading.Lock()
+_school_data: Optional[pd.DataFrame] = None
+_school_signature = None
+
+def get_school_data() -> pd.DataFrame:
+    """현재 학교 데이터 (여러 요청이 공유하므로 수정하지 말 것)"""
+    global _school_data, _school_signature
+    try:
+        stat = os.stat(SCHOOL_DATA_PATH)
+        signature = (SCHOOL_DATA_PATH, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        signature = (SCHOOL_DATA_PATH, None)
+    with _school_lock:
+        if _school_data is None or signature != _school_signature:
+            _school_data = load_school_data()
+            _school_signature = signature
+        return _school_data
+
+# 지도용 타일 인덱스: 학교 데이터 파일이 바뀔 때(스냅샷)마다 다시 생성
+_tile_lock = threading.Lock()
+_tile_index: Optional[TileIndex] = None
+_tile_signature = None
+
+def get_tile_index() -> TileIndex:
+    """현재 데이터 스냅샷의 타일 인덱스 (파일 경로/수정시각/크기로 변경 감지)"""
+    global _tile_index, _tile_signature
+    try:
+        stat = os.stat(SCHOOL_DATA_PATH)
+        signature = (SCHOOL_DATA_PATH, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        signature = (SCHOOL_DATA_PATH, None)
+    with _tile_lock:
+        if _tile_index is None or signature != _tile_signature:
+            df = load_school_data()
+            if df.attrs.get('sample'):
+                snapshot = "sample"
+            else:
+                with open(SCHOOL_DATA_PATH, "rb") as f:
+                    snapshot = hashlib.sha1(f.read()).hexdigest()[:12]
+            _tile_index = TileIndex(df, snapshot)
+            _tile_signature = signature
+        return _tile_index
+
+def cached_response(body: bytes, etag: str, if_none_match: Optional[str], snapshot: str) -> Response:
+    """ETag가 일치하면 304, 아니면 JSON 본문 반환"""
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=300",
+        "X-Data-Snapshot": snapshot,
+    }
+    if if_none_match and etag in [t.strip() for t in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@app.get("/tiles/{z}/{x}/{y}")
+def get_tile(z: int, x: int, y: int, if_none_match: Optional[str] = Header(None)):
+    """고정 줌 타일 안의 학교 목록 (스냅샷별로 미리 생성, ETag 지원)"""
+    if z != TILE_ZOOM:
+        raise HTTPException(status_code=404, detail=f"지원하는 줌 레벨은 {TILE_ZOOM}입니다.")
+    if not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+        raise HTTPException(status_code=404, detail="타일 좌표가 범위를 벗어났습니다.")
+    index = get_tile_index()
+    body, etag = index.tile(x, y)
+    return cached_response(body, etag, if_none_match, index.snapshot)
+
+@app.get("/schools/bbox", response_model=BBoxResponse)
+def schools_in_bbox(
+    min_lat: float = Query(..., ge=-90, le=90),
+    min_lon: float = Query(..., ge=-180, le=180),
+    max_lat: float = Query(..., ge=-90, le=90),
+    max_lon: float = Query(..., ge=-180, le=180),
+    if_none_match: Optional[str] = Header(None)
+):
+    """지도 영역(bbox) 안의 학교 목록 (영역을 덮는 타일만 확인)"""
+    if min_lat > max_lat or min_lon > max_lon:
+        raise HTTPException(status_code=400, detail="bbox의 최솟값이 최댓값보다 큽니다.")
+    if bbox_tile_count(min_lat, min_lon, max_lat, max_lon) > MAX_BBOX_TILES:
+        raise HTTPException(status_code=400, detail="지도 영역이 너무 넓습니다. 확대해주세요.")
+
+    index = get_tile_index()
+    bbox = {"min_lat": min_lat, "min_lon": min_lon, "max_lat": max_lat, "max_lon": max_lon}
+    etag = '"' + hashlib.sha1(f"{index.snapshot}:{sorted(bbox.items())}".encode()).hexdigest() + '"'
+    if if_none_match:
+        # 같은 스냅샷, 같은 bbox면 본문을 만들지 않고 304
+        response = cached_response(b"", etag, if_none_match, index.snapshot)
+        if response.status_code == 304:
+            return response
+    body = BBoxResponse(
+        snapshot=index.snapshot,
+        bbox=bbox,
+        schools=index.bbox(min_lat, min_lon, max_lat, max_lon)
+    ).model_dump_json().encode("utf-8")
+    return cached_response(body, etag, None, index.snapshot)
 
 @app.get("/search-schools")
 async def search_schools(
     apartment: str = Query(...),
     sort_by: str = Query("distance"),
-    radius: float = Query(3.0)
+    radius: float = Query(3.0),
+    lat: Optional[float] = Query(None, ge=-90, le=90),
+    lon: Optional[float] = Query(None, ge=-180, le=180)
 ) -> SearchResponse:
-    """아파트 주변 학교 검색"""
+    """아파트 주변 학교 검색 (자동완성으로 좌표를 받은 경우 지오코딩 생략)"""
     
-    # 아파트 좌표 얻기
-    coords = geocode_address(apartment)
-    if not coords:
-        raise HTTPException(status_code=404, detail="아파트를 찾을 수 없습니다.")
-    
-    lat, lon = coords
+    try:
+        # 처리 중 요청 수나 CPU 대기열이 한도를 넘으면 Kakao API 호출 전에 바로 거절
+        # (지오코딩 대기 중인 요청은 CPU 대기열이 아닌 처리 중 요청 한도에만 포함)
+        with search_pool.admit():
+            # 아파트 좌표 얻기 (블로킹 HTTP 호출이므로 스레드에서 실행)
+            if lat is None or lon is None:
+                coords = await run_in_threadpool(geocode_address, apartment)
+                if not coords:
+                    raise HTTPException(status_code=404, detail="아파트를 찾을 수 없습니다.")
+                lat, lon = coords
+
+            # CPU 작업은 워커 풀에서 실행해 이벤트 루프를 막지 않음 (이때만 워커 풀 자리 차지)
+            return await search_pool.run(build_search_response, apartment, lat, lon, radius, sort_by)
+    except PoolOverloaded as err:
+        raise overloaded(err)
+
+def overloaded(err: PoolOverloaded) -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="요청이 많아 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": str(err.retry_after)}
+    )
+
+def build_search_response(
+    apartment: str, lat: float, lon: float, radius: float, sort_by: str
+) -> SearchResponse:
+    """좌표 주변 학교를 찾아 응답 생성 (워커 풀에서 실행)"""
     
-    # 학교 데이터 로드
-    df = load_school_data()
+    # 학교 데이터 (캐시된 데이터를 수정하지 않도록 거리 컬럼은 복사본에 추가)
+    df = get_school_data()
     
-    # 거리 계산
-    df['distance_km'] = df.apply(
-        lambda r: haversine(lat, lon, r['latitude'], r['longitude']), axis=1)
+    # 거리 계산 (벡터 연산)
+    df = df.assign(distance_km=haversine(lat, lon, df['latitude'], df['longitude']))
     
     # 반경 내 학교 필터링
     nearby = df[df['distance_km'] <= radius].copy()
@@ -153,6 +341,32 @@ async def search_schools(
         schools=schools
     )
 
+@app.get("/suggest")
+def suggest(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=50)
+) -> SuggestResponse:
+    """이미 검색된 아파트명 자동완성 (Kakao API 호출 없음)"""
+    return SuggestResponse(
+        query=q,
+        suggestions=[Suggestion(**s) for s in suggest_index.search(q, limit)]
+    )
+
+@app.get("/data/status")
+def data_status():
+    """학교 데이터 상태: 샘플 데이터 사용 여부와 학교 수 (부하 테스트/모니터링용)"""
+    df = load_school_data()
+    return {
+        "path": os.path.abspath(SCHOOL_DATA_PATH),
+        "sample": bool(df.attrs.get('sample', False)),
+        "schools": len(df),
+    }
+
+@app.get("/search-pool/stats")
+def search_pool_stats():
+    """검색 워커 풀 대기열 길이/대기시간 (오토스케일링 지표)"""
+    return search_pool.stats()
+
 @app.get("/generate")
 def generate(prompt: str = Query(...)):
     """기존 텍스트 생성 엔드포인트 (호환성 유지)"""
@@ -37,17 +37,312 @@ environments that restrict outbound HTTP traffic, you may need to
 download the HTML manually through a browser and save it to disk.
 In such cases you can still parse the saved HTML using the helper
 ``parse_school_list`` function.
+
+Every request made by the crawler is recorded in a :class:`CrawlStats`
+instance (``crawler.stats``) with its elapsed time, response size,
+parse time and row count.  ``stats.write_report(path)`` writes these
+measurements as a JSON run report::
+
+    crawler = AsilCrawler()
+    crawler.fetch_school_list(area_code='11680')
+    crawler.stats.write_report('crawl_report.json')
 """
 
 from __future__ import annotations
 
+import json
+import os
 import re
-from typing import Dict, List, Tuple, Iterable, Optional
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple, Iterable, Optional
 
 import bs4  # type: ignore
 import requests
 
 
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+class CrawlStats:
+    """Timing, size and row-count measurements for a crawl run.
+
+    One record is kept per POST request.  A record holds the form
+    payload, the HTTP status, the response size in bytes, the time
+    spent waiting for the response and, once the page has been
+    parsed, the parse time and the number of rows extracted.
+
+    Attributes
+    ----------
+    records : list of dict
+        Per-request records in the order the requests were made.
+    started_at : str
+        ISO 8601 timestamp (UTC) at which the run started.
+    finished_at : str or None
+        End timestamp of a combined run (see :meth:`from_reports`).  For
+        a live run it is taken when :meth:`summary` is called.
+    duration_seconds : float or None
+        Wall-clock duration of a combined run.
+    ordering_mismatches : list of dict
+        Locally derived orderings that did not match the server's (see
+        :meth:`record_ordering_mismatch`).
+    """
+
+    def __init__(self, records: Optional[List[Dict[str, Any]]] = None) -> None:
+        self.records: List[Dict[str, Any]] = list(records or [])
+        self.ordering_mismatches: List[Dict[str, Any]] = []
+        self.started_at = _utc_now()
+        self.finished_at: Optional[str] = None
+        self.duration_seconds: Optional[float] = None
+        self._start: Optional[float] = time.perf_counter()
+
+    def record_fetch(
+        self,
+        payload: Dict[str, str],
+        status: Optional[int],
+        nbytes: int,
+        fetch_seconds: float,
+        error: Optional[str] = None,
+        small_response: bool = False,
+    ) -> Dict[str, Any]:
+        """Record a single POST request and return its record."""
+        record: Dict[str, Any] = {
+            **payload,
+            "status": status,
+            "bytes": nbytes,
+            "fetch_seconds": round(fetch_seconds, 6),
+            "parse_seconds": None,
+            "rows": None,
+            "small_response": small_response,
+            "error": error,
+        }
+        self.records.append(record)
+        return record
+
+    @staticmethod
+    def record_parse(record: Dict[str, Any], parse_seconds: float, rows: int) -> None:
+        """Attach parse time and row count to a fetch record."""
+        record["parse_seconds"] = round(parse_seconds, 6)
+        record["rows"] = rows
+
+    def record_ordering_mismatch(self, payload: Dict[str, str], problems: List[str]) -> None:
+        """Record that a derived ordering differed from the server's."""
+        self.ordering_mismatches.append({**payload, "problems": problems})
+
+    @staticmethod
+    def _aggregate(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        totals: Dict[str, Any] = {
+            "requests": 0,
+            "errors": 0,
+            "small_responses": 0,
+            "bytes": 0,
+            "rows": 0,
+            "fetch_seconds": 0.0,
+            "parse_seconds": 0.0,
+            "max_fetch_seconds": 0.0,
+        }
+        for rec in records:
+            totals["requests"] += 1
+            totals["errors"] += rec.get("error") is not None
+            totals["small_responses"] += bool(rec.get("small_response"))
+            totals["bytes"] += rec.get("bytes") or 0
+            totals["rows"] += rec.get("rows") or 0
+            totals["fetch_seconds"] += rec.get("fetch_seconds") or 0.0
+            totals["parse_seconds"] += rec.get("parse_seconds") or 0.0
+            totals["max_fetch_seconds"] = max(
+                totals["max_fetch_seconds"], rec.get("fetch_seconds") or 0.0
+            )
+        for key in ("fetch_seconds", "parse_seconds", "max_fetch_seconds"):
+            totals[key] = round(totals[key], 6)
+        return totals
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the run report as a JSON-serialisable dictionary.
+
+        The report contains overall totals, the same totals grouped by
+        area code, the raw per-request records and any ordering
+        mismatches found by verification.
+        """
+        by_area: Dict[str, List[Dict[str, Any]]] = {}
+        for rec in self.records:
+            by_area.setdefault(rec.get("area", ""), []).append(rec)
+        if self._start is not None:
+            finished_at = _utc_now()
+            duration = round(time.perf_counter() - self._start, 6)
+        else:
+            finished_at, duration = self.finished_at, self.duration_seconds
+        return {
+            "started_at": self.started_at,
+            "finished_at": finished_at,
+            "duration_seconds": duration,
+            "totals": self._aggregate(self.records),
+            "areas": {area: self._aggregate(recs) for area, recs in sorted(by_area.items())},
+            "requests": self.records,
+            "ordering_mismatches": self.ordering_mismatches,
+        }
+
+    def write_report(self, path: str) -> Dict[str, Any]:
+        """Write :meth:`summary` to ``path`` as JSON and return it.
+
+        The file is written to a temporary name first and then renamed
+        so that readers never observe a partially written report.
+        """
+        report = self.summary()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+        return report
+
+    @classmethod
+    def from_reports(cls, paths: Iterable[str]) -> "CrawlStats":
+        """Combine the per-request records of several saved reports.
+
+        The combined run spans from the earliest child start to the
+        latest child finish; its duration is that wall-clock span, not
+        the time spent combining the reports.  When no child report
+        carries timestamps, both are left out (``None``).
+        """
+        records: List[Dict[str, Any]] = []
+        mismatches: List[Dict[str, Any]] = []
+        started: List[str] = []
+        finished: List[str] = []
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                report = json.load(f)
+            records.extend(report.get("requests", []))
+            mismatches.extend(report.get("ordering_mismatches", []))
+            if report.get("started_at"):
+                started.append(report["started_at"])
+            if report.get("finished_at"):
+                finished.append(report["finished_at"])
+        stats = cls(records)
+        stats.ordering_mismatches = mismatches
+        stats.started_at = min(started) if started else None
+        stats.finished_at = max(finished) if finished else None
+        # Timings come from the child reports, not from this process.
+        stats._start = None
+        if started and finished:
+            span = (datetime.fromisoformat(stats.finished_at)
+                    - datetime.fromisoformat(stats.started_at))
+            stats.duration_seconds = round(span.total_seconds(), 6)
+        return stats
+
+
+#: Table column that each server-side ``order`` value sorts by.
+ORDER_COLUMNS: Dict[str, str] = {
+    "1": "average",       # 학업성취도순
+    "7": "special_rate",  # 진학률순
+}
+
+
+def _sort_value(value: str) -> Optional[float]:
+    """Convert a table cell such as ``'87.3'`` or ``'12.5%'`` to a float."""
+    try:
+        return float(value.replace("%", "").replace(",", "").strip())
+    except (AttributeError, ValueError):
+        return None
+
+
+def derive_ordering(
+    rows: List[Dict[str, str]],
+    column: str,
+    orderby: str = "desc",
+    rank_key: str = "rank",
+) -> List[Dict[str, str]]:
+    """Re-sort parsed rows locally as the server would for ``column``.
+
+    Every ordering of the school list returns the same rows and
+    columns, only sorted differently.  This function reproduces a
+    server-side ordering from rows fetched with another one, so that
+    several metrics can be derived from a single request.
+
+    Parameters
+    ----------
+    rows : list of dict
+        Parsed table rows from any ordering.
+    column : str
+        Column to sort by, e.g. ``'average'`` or ``'special_rate'``.
+    orderby : str, optional
+        ``'asc'`` or ``'desc'``.  Defaults to ``'desc'``.
+    rank_key : str, optional
+        Key whose value is replaced by the new rank.  Rows with equal
+        values share a rank (1, 2, 2, 4, ...).
+
+    Returns
+    -------
+    list of dict
+        New row dictionaries in the derived order.  Rows whose value
+        is not numeric are placed last, in their original order.
+    """
+    numeric = [row for row in rows if _sort_value(row.get(column, "")) is not None]
+    missing = [row for row in rows if _sort_value(row.get(column, "")) is None]
+    numeric.sort(key=lambda row: _sort_value(row[column]), reverse=(orderby == "desc"))
+
+    derived: List[Dict[str, str]] = []
+    previous: Optional[float] = None
+    rank = 0
+    for position, row in enumerate(numeric + missing, start=1):
+        value = _sort_value(row.get(column, ""))
+        if value is None or value != previous:
+            rank = position
+        previous = value
+        derived.append({**row, rank_key: str(rank)})
+    return derived
+
+
+def compare_orderings(
+    derived: List[Dict[str, str]],
+    server: List[Dict[str, str]],
+    column: str,
+    name_key: str = "school_name",
+) -> List[str]:
+    """Return the differences between a derived and a server ordering.
+
+    Rows that tie on ``column`` may legitimately appear in a different
+    order, so the comparison is made per group of equal values: the
+    sequence of values and the set of schools within each group must
+    match.  Each school's rank must also match the server's.
+
+    Returns
+    -------
+    list of str
+        Human-readable descriptions of the mismatches; empty if the
+        orderings agree.
+    """
+    def groups(rows: List[Dict[str, str]]) -> List[Tuple[str, frozenset]]:
+        result: List[Tuple[str, set]] = []
+        for row in rows:
+            value = row.get(column, "")
+            if not result or result[-1][0] != value:
+                result.append((value, set()))
+            result[-1][1].add((row.get(name_key), row.get("location")))
+        return [(value, frozenset(names)) for value, names in result]
+
+    problems: List[str] = []
+    if len(derived) != len(server):
+        problems.append(f"row count {len(derived)} != server {len(server)}")
+    for i, (d, s) in enumerate(zip(groups(derived), groups(server))):
+        if d != s:
+            problems.append(
+                f"group {i}: derived {d[0]!r} {sorted(d[1])} != server {s[0]!r} {sorted(s[1])}"
+            )
+            break
+    server_ranks = {(row.get(name_key), row.get("location")): row.get("rank") for row in server}
+    for row in derived:
+        school = (row.get(name_key), row.get("location"))
+        if school in server_ranks and server_ranks[school] != row.get("rank"):
+            problems.append(
+                f"rank of {school[0]!r}: derived {row.get('rank')} != server {server_ranks[school]}"
+            )
+            break
+    return problems
+
+
 class AsilCrawler:
     """Crawler for the ASIL school ranking pages.
 
@@ -66,11 +361,16 @@ class AsilCrawler:
         Persistent session used for all HTTP requests.  Custom
         headers are applied to each request via
         ``session.headers.update``.
+    stats : CrawlStats
+        Measurements of every request made by this crawler.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, stats: Optional[CrawlStats] = None) -> None:
         self.base_url = "http://asil.kr/asil/sub/school_list.jsp"
         self.session = requests.Session()
+        self.stats = stats if stats is not None else CrawlStats()
+        # Record of the most recent request, completed by the parser.
+        self.last_request: Optional[Dict[str, Any]] = None
         # Provide a realistic User‑Agent to avoid being blocked.  The
         # Referer and Origin headers mimic what the browser would send
         # when submitting the form.
@@ -112,7 +412,8 @@ class AsilCrawler:
         The site uses POST requests.  This helper performs a POST
         submission using the session.  Should the request fail with
         HTTP 403, a ``RuntimeError`` is raised with a helpful error
-        message.
+        message.  Every attempt, successful or not, is recorded in
+        ``self.stats`` and exposed as ``self.last_request``.
 
         Parameters
         ----------
@@ -132,7 +433,16 @@ class AsilCrawler:
             "order": form.get("order", "1"),     # 학업성취도순
             "orderby": form.get("orderby", "desc"),
         }
-        response = self.session.post(self.base_url, data=payload)
+        start = time.perf_counter()
+        try:
+            response = self.session.post(self.base_url, data=payload)
+        except requests.RequestException as err:
+            self.last_request = self.stats.record_fetch(
+                payload, None, 0, time.perf_counter() - start, error=repr(err)
+            )
+            raise
+        elapsed = time.perf_counter() - start
+        nbytes = len(response.content)
         # Many sites return 200 status codes even on errors.  Check
         # explicitly for a tiny content length, which may be the
         # restricted page returned by our environment.  Still raise
@@ -144,17 +454,28 @@ class AsilCrawler:
                 f"Failed to fetch data from {self.base_url}: "
                 f"HTTP {response.status_code}."
             )
+            self.last_request = self.stats.record_fetch(
+                payload, response.status_code, nbytes, elapsed, error=msg
+            )
             raise RuntimeError(msg) from err
-        if len(response.content) < 500:
+        if nbytes < 500:
             # When running in the LLAMA container the remote host
             # returns a short error page instructing the user to use
             # the browser.  Surface this as a runtime error to the
             # caller rather than silently returning an empty page.
-            raise RuntimeError(
+            msg = (
                 "Received unexpectedly small response. "
                 "This may indicate network restrictions in the "
                 "current environment."
             )
+            self.last_request = self.stats.record_fetch(
+                payload, response.status_code, nbytes, elapsed,
+                error=msg, small_response=True,
+            )
+            raise RuntimeError(msg)
+        self.last_request = self.stats.record_fetch(
+            payload, response.status_code, nbytes, elapsed
+        )
         return response.text
 
     def get_province_codes(self) -> Dict[str, str]:
@@ -289,7 +610,72 @@ class AsilCrawler:
             ``rank``, ``location``, ``school_name`` and so on.
         """
         html = self._get_page(area=area_code, type1=type1, order=order, orderby=orderby)
-        return self.parse_school_list(html)
+        start = time.perf_counter()
+        rows = self.parse_school_list(html)
+        if self.last_request is not None:
+            self.stats.record_parse(self.last_request, time.perf_counter() - start, len(rows))
+        return rows
 
+    def fetch_school_lists(
+        self,
+        area_code: str,
+        type1: str = "3",
+        orders: Iterable[str] = ("1", "7"),
+        orderby: str = "desc",
+        verify: bool = False,
+    ) -> Dict[str, List[Dict[str, str]]]:
+        """Fetch several orderings of an area's school list in one request.
+
+        The first order in ``orders`` is fetched from the server; the
+        others are derived locally with :func:`derive_ordering`, which
+        halves the number of POSTs for the usual achievement plus
+        progression crawl.
 
-__all__ = ["AsilCrawler"]
\ No newline at end of file
+        Parameters
+        ----------
+        area_code, type1, orderby : str
+            As for :meth:`fetch_school_list`.
+        orders : iterable of str, optional
+            Server ``order`` values to produce.  Each must be a key of
+            ``ORDER_COLUMNS``.  Defaults to ``('1', '7')``.
+        verify : bool, optional
+            When true, also fetch every derived ordering from the server.
+            The server rows are returned for that order, and any
+            mismatch with the derived rows is recorded in
+            ``self.stats`` (see :meth:`CrawlStats.record_ordering_mismatch`)
+            rather than raised.  Useful to check the derivation after the
+            site changes.
+
+        Returns
+        -------
+        dict
+            Mapping from each order value to its parsed rows.
+        """
+        orders = list(orders)
+        unknown = [order for order in orders if order not in ORDER_COLUMNS]
+        if unknown:
+            raise ValueError(f"Cannot derive ordering for order={unknown}.")
+        base = self.fetch_school_list(area_code, type1=type1, order=orders[0], orderby=orderby)
+        results = {orders[0]: base}
+        for order in orders[1:]:
+            results[order] = derive_ordering(base, ORDER_COLUMNS[order], orderby)
+            if verify:
+                server = self.fetch_school_list(area_code, type1=type1, order=order, orderby=orderby)
+                problems = compare_orderings(results[order], server, ORDER_COLUMNS[order])
+                if problems:
+                    self.stats.record_ordering_mismatch(
+                        {"area": area_code, "type1": type1, "order": order, "orderby": orderby},
+                        problems,
+                    )
+                # The server ordering is authoritative once it has been fetched.
+                results[order] = server
+        return results
+
+
+__all__ = [
+    "AsilCrawler",
+    "CrawlStats",
+    "ORDER_COLUMNS",
+    "compare_orderings",
+    "derive_ordering",
+]
\ No newline at end of file
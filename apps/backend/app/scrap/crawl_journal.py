@@ -0,0 +1,168 @@
+"""
+crawl_journal.py
+=================
+
+A small append-only journal that makes long crawls resumable.
+
+A nationwide refresh loops over hundreds of area, school type and
+metric combinations.  Each completed combination is appended to the
+journal as one JSON line holding the form payload, the output file and
+its SHA-256 digest.  When a crawl is restarted after a failure, the
+payloads already recorded (and whose output files are still intact)
+are skipped.
+
+Usage example::
+
+    from crawl_journal import CrawlJournal
+
+    journal = CrawlJournal('data/.crawl_journal.jsonl')
+    payload = {'area': '11680', 'type1': '3', 'order': '1', 'orderby': 'desc'}
+    if not journal.is_done(payload):
+        rows = crawler.fetch_school_list(area_code='11680')
+        save_to_csv(rows, 'data/achievement_11680_3.csv')
+        journal.record(payload, 'data/achievement_11680_3.csv', len(rows))
+    # After every payload succeeded:
+    journal.finish()
+
+The journal key is the form payload only, so each script must use its
+own journal file: two scripts sharing one would skip each other's
+payloads and remove each other's resume state on :meth:`finish`.
+
+Entries are written with ``fsync`` so that a crash never loses a
+completed entry.  A partially written trailing line is cut off on load,
+so the next entry starts on a fresh line instead of being appended to
+the torn one.
+Output files should themselves be written atomically (temporary file
+followed by ``os.replace``) so that a recorded digest always refers to
+a complete file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+
+def file_sha256(path: str) -> str:
+    """Return the hex SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CrawlJournal:
+    """Append-only record of completed crawl payloads.
+
+    Attributes
+    ----------
+    path : str
+        Location of the JSON-lines journal file.
+    entries : dict
+        Completed entries keyed by the canonical payload key.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    @staticmethod
+    def key(payload: Dict[str, str]) -> str:
+        """Return a canonical key for a form payload."""
+        return json.dumps(payload, sort_keys=True, ensure_ascii=False)
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+        if data and not data.endswith(b"\n"):
+            # A crash while appending leaves a truncated last line; drop it
+            # so that the next record() does not get glued onto it.
+            data = data[:data.rfind(b"\n") + 1]
+            with open(self.path, "r+b") as f:
+                f.truncate(len(data))
+                f.flush()
+                os.fsync(f.fileno())
+        for line in data.decode("utf-8", errors="replace").splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(entry, dict) or "key" not in entry:
+                # Not one of our entries; ignore it like an unreadable line.
+                continue
+            self.entries[entry["key"]] = entry
+
+    def is_done(self, payload: Dict[str, str]) -> bool:
+        """Return whether ``payload`` completed and its output is intact.
+
+        An entry whose output file has since been removed or modified
+        is treated as not done, so the payload is fetched again.
+        """
+        entry = self.entries.get(self.key(payload))
+        if entry is None:
+            return False
+        output = entry.get("output")
+        if output is None:
+            # Completed with no rows; nothing was written.
+            return True
+        try:
+            return file_sha256(output) == entry.get("sha256")
+        except OSError:
+            return False
+
+    def record(self, payload: Dict[str, str], output: Optional[str], rows: int) -> None:
+        """Append a completed payload and its output file to the journal.
+
+        Parameters
+        ----------
+        payload : dict
+            Form fields that were submitted.
+        output : str or None
+            Path of the file written for this payload, or ``None`` when
+            the response contained no rows and nothing was written.
+        rows : int
+            Number of rows parsed from the response.
+        """
+        entry = {
+            "key": self.key(payload),
+            "payload": payload,
+            "output": output,
+            "sha256": file_sha256(output) if output else None,
+            "rows": rows,
+            "completed_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.entries[entry["key"]] = entry
+
+    def reset(self) -> None:
+        """Forget all entries and remove the journal file."""
+        self.entries.clear()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def finish(self) -> None:
+        """Mark the crawl as complete.
+
+        The journal only describes an unfinished run; once every payload
+        succeeded it is removed so that the next run starts afresh.
+        """
+        self.reset()
+
+
+__all__ = ["CrawlJournal", "file_sha256"]
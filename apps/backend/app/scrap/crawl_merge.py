@@ -0,0 +1,127 @@
+"""
+crawl_merge.py
+=================
+
+Helpers used by the daily DAG to combine the per-province crawl output.
+
+The DAG runs ``scrap.py`` once per province, writing
+``<run_dir>/provinces/<area>/<metric>_<area>_<type>.csv``.  This module
+merges those files into ``<run_dir>/<metric>_all_<type>.csv``, re-ranked
+nationwide by the metric's column, and computes a content fingerprint used to skip the rebuild on days when
+nothing changed.
+
+Usage example::
+
+    from crawl_merge import merge_province_csvs, compute_fingerprint
+
+    merged = merge_province_csvs('data/2025-08-07')
+    fingerprint = compute_fingerprint('data/2025-08-07')
+"""
+
+from __future__ import annotations
+
+import csv
+import glob
+import hashlib
+import os
+from typing import Dict, List, Tuple
+
+from asil_crawler import ORDER_COLUMNS, derive_ordering
+
+#: Server ``order`` value that each scraped metric is sorted by.
+METRIC_ORDERS: Dict[str, str] = {
+    "achievement": "1",   # 학업성취도순
+    "progression": "7",   # 진학률순
+}
+
+
+def province_csvs(run_dir: str) -> List[str]:
+    """Return the per-province CSV files of a run, sorted."""
+    return sorted(glob.glob(os.path.join(run_dir, "provinces", "*", "*.csv")))
+
+
+def compute_fingerprint(run_dir: str) -> str:
+    """Return a SHA-256 fingerprint of a run's per-province CSV files.
+
+    Paths are hashed relative to the run's ``provinces`` directory, so
+    two runs with identical content on different dates produce the
+    same fingerprint.
+
+    Parameters
+    ----------
+    run_dir : str
+        Directory of one DAG run, e.g. ``data/2025-08-07``.
+
+    Returns
+    -------
+    str
+        Hex digest over every file's relative path and content.
+    """
+    provinces_dir = os.path.join(run_dir, "provinces")
+    digest = hashlib.sha256()
+    for path in province_csvs(run_dir):
+        digest.update(os.path.relpath(path, provinces_dir).encode("utf-8"))
+        digest.update(b"\0")
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def merge_province_csvs(run_dir: str) -> List[str]:
+    """Merge per-province CSV files into one file per metric and type.
+
+    The rows of all ``<metric>_<area>_<type>.csv`` files are combined
+    and re-sorted in descending order of the metric's column with
+    :func:`derive_ordering`, so ``rank`` is the nationwide rank rather
+    than each province's own.  The result is written to
+    ``<run_dir>/<metric>_all_<type>.csv`` under a temporary name and
+    then renamed.
+
+    Returns
+    -------
+    list of str
+        Paths of the merged files.
+
+    Raises
+    ------
+    RuntimeError
+        If the run directory contains no per-province CSV files.
+    ValueError
+        If a file's metric is not a key of ``METRIC_ORDERS``.
+    """
+    paths = province_csvs(run_dir)
+    if not paths:
+        raise RuntimeError(f"No scraped CSV files found under {run_dir}")
+
+    groups: Dict[Tuple[str, str], List[str]] = {}
+    for path in paths:
+        metric, _area, type1 = os.path.basename(path)[:-len(".csv")].split("_")
+        groups.setdefault((metric, type1), []).append(path)
+
+    merged: List[str] = []
+    for (metric, type1), group in sorted(groups.items()):
+        if metric not in METRIC_ORDERS:
+            raise ValueError(f"Unknown metric {metric!r} in {group[0]}")
+        fieldnames: List[str] = []
+        rows: List[Dict[str, str]] = []
+        for path in group:
+            with open(path, newline="", encoding="utf-8-sig") as f:
+                reader = csv.DictReader(f)
+                fieldnames = fieldnames or list(reader.fieldnames or [])
+                rows.extend(reader)
+        rows = derive_ordering(rows, ORDER_COLUMNS[METRIC_ORDERS[metric]], "desc")
+
+        merged_path = os.path.join(run_dir, f"{metric}_all_{type1}.csv")
+        tmp_path = merged_path + ".tmp"
+        with open(tmp_path, "w", newline="", encoding="utf-8-sig") as out:
+            writer = csv.DictWriter(out, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(tmp_path, merged_path)
+        merged.append(merged_path)
+    return merged
+
+
+__all__ = ["METRIC_ORDERS", "compute_fingerprint", "merge_province_csvs", "province_csvs"]
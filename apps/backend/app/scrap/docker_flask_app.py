@@ -88,9 +88,14 @@ def index():
             return redirect(url_for('index'))
 
         s_type = request.form['school_type']
-        for metric in request.form.getlist('metric'):
-            order = '1' if metric=='achievement' else '7'
-            data = crawler.fetch_school_list(area_code=area, type1=s_type, order=order, orderby='desc')
+        metrics = request.form.getlist('metric')
+        # 한 번만 요청하고 지표별 정렬은 로컬에서 계산
+        orders = {metric: '1' if metric=='achievement' else '7' for metric in metrics}
+        by_order = crawler.fetch_school_lists(area_code=area, type1=s_type,
+                                              orders=list(dict.fromkeys(orders.values())),
+                                              orderby='desc')
+        for metric in metrics:
+            data = by_order[orders[metric]]
             fname = f"{metric}_{area}_{s_type}.csv"
             fpath = os.path.join(DATA_DIR, fname)
             if data:
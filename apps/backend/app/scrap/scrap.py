@@ -1,7 +1,8 @@
 import argparse
 import os
 import csv
-from asil_crawler import AsilCrawler
+from asil_crawler import AsilCrawler, CrawlStats
+from crawl_journal import CrawlJournal
 
 
 def parse_args():
@@ -10,14 +11,21 @@ def parse_args():
     )
     parser.add_argument(
         "--area",
-        default="11680",
-        help="지역 코드 (예: 11=서울, 11680=서울 강남구)",
+        nargs='+',
+        default=["11680"],
+        help="지역 코드 (예: 11=서울, 11680=서울 강남구), 여러 개 지정 가능",
+    )
+    parser.add_argument(
+        "--districts",
+        action="store_true",
+        help="--area로 지정한 시/도의 모든 구/군을 각각 크롤링",
     )
     parser.add_argument(
         "--type",
+        nargs='+',
         choices=["3", "4"],
-        default="3",
-        help="학교 유형 (3=중학교, 4=고등학교)",
+        default=["3"],
+        help="학교 유형 (3=중학교, 4=고등학교), 여러 개 지정 가능",
     )
     parser.add_argument(
         "--metrics",
@@ -31,46 +39,141 @@ def parse_args():
         default=".",
         help="CSV 파일을 저장할 디렉토리",
     )
+    parser.add_argument(
+        "--report",
+        default=None,
+        help="요청별 소요시간/바이트/행 수를 기록한 JSON 실행 리포트 경로",
+    )
+    parser.add_argument(
+        "--journal",
+        default=None,
+        help="완료된 요청을 기록하는 저널 경로 (기본: <output-dir>/.scrap_journal.jsonl)",
+    )
+    parser.add_argument(
+        "--single-pass",
+        action="store_true",
+        help="지역마다 한 번만 요청하고 나머지 지표의 정렬은 로컬에서 계산",
+    )
+    parser.add_argument(
+        "--verify-ordering",
+        action="store_true",
+        help="--single-pass로 계산한 정렬을 서버 정렬과 비교해 서버 결과를 저장하고, 다르면 리포트에 기록 (요청 수는 줄지 않음)",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--resume",
+        dest="force",
+        action="store_false",
+        default=False,
+        help="저널에 기록된 완료 요청은 건너뛰고 이어서 크롤링 (기본값)",
+    )
+    mode.add_argument(
+        "--force",
+        dest="force",
+        action="store_true",
+        help="저널을 무시하고 처음부터 다시 크롤링",
+    )
     return parser.parse_args()
 
 
 def save_to_csv(data, filepath):
     if not data:
         print(f"경고: 저장할 데이터가 없습니다. ({filepath})")
-        return
+        return False
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     # CSV 헤더는 dict의 키 순서대로
     fieldnames = list(data[0].keys())
-    with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
+    # 임시 파일에 쓴 뒤 교체하여 중단되어도 불완전한 파일이 남지 않게 함
+    tmp_path = filepath + '.tmp'
+    with open(tmp_path, 'w', newline='', encoding='utf-8-sig') as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         writer.writerows(data)
+    os.replace(tmp_path, filepath)
     print(f"Saved {len(data)} rows -> {filepath}")
+    return True
 
 
 def main():
     args = parse_args()
-    crawler = AsilCrawler()
+    crawler = AsilCrawler(stats=CrawlStats())
+    try:
+        crawl(args, crawler)
+        for mismatch in crawler.stats.ordering_mismatches:
+            print(f"WARNING: derived order={mismatch['order']} differs from the server "
+                  f"for area {mismatch['area']}: {'; '.join(mismatch['problems'])}")
+    finally:
+        # 실패한 실행도 원인 분석을 위해 리포트를 남김
+        if args.report:
+            report = crawler.stats.write_report(args.report)
+            print(f"Report ({report['totals']['requests']} requests) -> {args.report}")
+
 
+def crawl(args, crawler):
     # metric 별로 order/orderby 설정
     metric_map = {
         'achievement': ('1', 'desc'),  # 학업성취도순
         'progression': ('7', 'desc'),   # 진학률순
     }
 
-    for metric in args.metrics:
-        order, orderby = metric_map[metric]
-        # 데이터 가져오기
-        data = crawler.fetch_school_list(
-            area_code=args.area,
-            type1=args.type,
-            order=order,
-            orderby=orderby,
-        )
-        # 파일명: metrics_area_type.csv
-        filename = f"{metric}_{args.area}_{args.type}.csv"
-        filepath = os.path.join(args.output_dir, filename)
-        save_to_csv(data, filepath)
+    areas = args.area
+    if args.districts:
+        # 시/도 코드를 구/군 코드 목록으로 확장 (시/도 전체 항목은 제외)
+        areas = [
+            code
+            for province in args.area
+            for code in crawler.get_district_codes(province)
+            if code and code != province
+        ]
+
+    journal = CrawlJournal(
+        args.journal or os.path.join(args.output_dir, '.scrap_journal.jsonl')
+    )
+    if args.force:
+        journal.reset()
+    elif journal.entries:
+        print(f"Resuming: {len(journal.entries)} completed requests in {journal.path}")
+
+    for area in areas:
+        for type1 in args.type:
+            payloads = {
+                metric: {'area': area, 'type1': type1,
+                         'order': metric_map[metric][0], 'orderby': metric_map[metric][1]}
+                for metric in args.metrics
+            }
+            pending = [m for m in args.metrics if not journal.is_done(payloads[m])]
+            if not pending:
+                continue
+            # 데이터 가져오기
+            if args.single_pass:
+                # 한 번의 요청으로 받은 표를 지표별로 다시 정렬
+                by_order = crawler.fetch_school_lists(
+                    area_code=area,
+                    type1=type1,
+                    orders=[metric_map[m][0] for m in pending],
+                    orderby=metric_map[pending[0]][1],
+                    verify=args.verify_ordering,
+                )
+            else:
+                by_order = {
+                    metric_map[m][0]: crawler.fetch_school_list(
+                        area_code=area,
+                        type1=type1,
+                        order=metric_map[m][0],
+                        orderby=metric_map[m][1],
+                    )
+                    for m in pending
+                }
+            for metric in pending:
+                data = by_order[metric_map[metric][0]]
+                # 파일명: metrics_area_type.csv
+                filename = f"{metric}_{area}_{type1}.csv"
+                filepath = os.path.join(args.output_dir, filename)
+                saved = save_to_csv(data, filepath)
+                journal.record(payloads[metric], filepath if saved else None, len(data))
+
+    # 모든 요청이 끝났으면 저널 삭제 (다음 실행은 처음부터)
+    journal.finish()
 
 
 if __name__ == '__main__':
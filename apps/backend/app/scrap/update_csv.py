@@ -4,12 +4,17 @@
 # 이 스크립트는 학교알리미(asil.kr)에서 지정한 지역·학교유형의
 # 학업성취도(achievement) 및 진학률(progression) 데이터를
 # 실시간으로 크롤링하여 CSV 파일로 저장(갱신)합니다.
+# --input-dir 를 지정하면 크롤링하지 않고, scrap.py 결과(병합된 CSV)를
+# 읽어 이 스크립트의 컬럼명으로 바꿔 저장합니다.
 
 import argparse
 import os
 import csv
+import time
 import requests
 from bs4 import BeautifulSoup
+from asil_crawler import ORDER_COLUMNS, CrawlStats, compare_orderings, derive_ordering
+from crawl_journal import CrawlJournal
 
 # 크롤링에 사용할 기본 URL 및 헤더
 BASE_URL = 'http://asil.kr/asil/sub/school_list.jsp'
@@ -23,11 +28,29 @@ HEADERS = {
     'Origin': 'http://asil.kr'
 }
 
+# scrap.py(AsilCrawler) 결과 컬럼명 -> 이 스크립트의 컬럼명
+CRAWLER_COLUMNS = {
+    'examinee_count': 'applicants',
+    'special_rate': 'special_ratio',
+    'special_breakdown': 'special_count',
+}
+
+
+def load_scraped_csv(filepath: str) -> list[dict]:
+    """scrap.py가 저장한 CSV를 읽어 이 스크립트의 컬럼명으로 변환"""
+    with open(filepath, newline='', encoding='utf-8-sig') as f:
+        return [
+            {CRAWLER_COLUMNS.get(key, key): value for key, value in row.items()}
+            for row in csv.DictReader(f)
+        ]
 
-def fetch_school_list(area: str, type1: str, order: str, orderby: str) -> list[dict]:
+
+def fetch_school_list(area: str, type1: str, order: str, orderby: str,
+                      stats: CrawlStats | None = None) -> list[dict]:
     """
     주어진 파라미터로 POST 요청을 보내고, 두 번째 .tbList 테이블을 파싱하여
     학교 목록을 반환합니다.
+    stats가 주어지면 요청 소요시간, 응답 바이트, 파싱 시간, 행 수를 기록합니다.
     """
     session = requests.Session()
     session.headers.update(HEADERS)
@@ -37,10 +60,61 @@ def fetch_school_list(area: str, type1: str, order: str, orderby: str) -> list[d
         'order': order,
         'orderby': orderby,
     }
-    resp = session.post(BASE_URL, data=payload)
+    start = time.perf_counter()
+    try:
+        resp = session.post(BASE_URL, data=payload)
+    except requests.RequestException as err:
+        # 타임아웃/연결 오류도 실패한 요청으로 기록
+        if stats is not None:
+            stats.record_fetch(payload, None, 0, time.perf_counter() - start,
+                               error=repr(err))
+        raise
+    record = None
+    if stats is not None:
+        error = f"HTTP {resp.status_code}" if not resp.ok else None
+        record = stats.record_fetch(payload, resp.status_code, len(resp.content),
+                                    time.perf_counter() - start, error=error)
     resp.raise_for_status()
 
-    soup = BeautifulSoup(resp.text, 'html.parser')
+    start = time.perf_counter()
+    data = parse_school_list(resp.text)
+    if record is not None:
+        stats.record_parse(record, time.perf_counter() - start, len(data))
+    return data
+
+
+def fetch_school_lists(area: str, type1: str, orders: list[str], orderby: str,
+                       stats: CrawlStats | None = None,
+                       verify: bool = False) -> dict[str, list[dict]]:
+    """
+    첫 번째 order로 한 번만 요청하고, 나머지 order의 정렬은 같은 표를
+    로컬에서 다시 정렬해 만듭니다. (지표별 요청 대비 요청 수 절반)
+    verify가 True이면 서버 정렬 결과도 받아 비교하고, 서버 결과를 저장합니다.
+    (다르면 stats에 기록하고 경고만 출력)
+    """
+    base = fetch_school_list(area, type1, orders[0], orderby, stats=stats)
+    results = {orders[0]: base}
+    for order in orders[1:]:
+        # 정렬 기준 컬럼(asil_crawler 컬럼명)을 이 스크립트의 컬럼명으로 변환
+        column = CRAWLER_COLUMNS.get(ORDER_COLUMNS[order], ORDER_COLUMNS[order])
+        results[order] = derive_ordering(base, column, orderby)
+        if verify:
+            server = fetch_school_list(area, type1, order, orderby, stats=stats)
+            problems = compare_orderings(results[order], server, column)
+            if problems:
+                payload = {'area': area, 'type1': type1, 'order': order, 'orderby': orderby}
+                if stats is not None:
+                    stats.record_ordering_mismatch(payload, problems)
+                print(f"order={order} 로컬 정렬이 서버 결과와 다릅니다 ({area}): "
+                      + '; '.join(problems))
+            # 서버 결과를 받았으므로 서버 정렬을 저장
+            results[order] = server
+    return results
+
+
+def parse_school_list(html: str) -> list[dict]:
+    """두 번째 .tbList 테이블을 파싱하여 학교 목록을 반환합니다."""
+    soup = BeautifulSoup(html, 'html.parser')
     tables = soup.select('div.tbList')
     # 첫 번째 tbList는 헤더, 두 번째부터 실제 데이터
     if len(tables) < 2:
@@ -69,17 +143,21 @@ def fetch_school_list(area: str, type1: str, order: str, orderby: str) -> list[d
     return data
 
 
-def save_to_csv(data: list[dict], filepath: str):
+def save_to_csv(data: list[dict], filepath: str) -> bool:
     if not data:
         print(f"경고: 저장할 데이터가 없습니다. ({filepath})")
-        return
+        return False
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     fieldnames = list(data[0].keys())
-    with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
+    # 임시 파일에 쓴 뒤 교체하여 중단되어도 불완전한 파일이 남지 않게 함
+    tmp_path = filepath + '.tmp'
+    with open(tmp_path, 'w', newline='', encoding='utf-8-sig') as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         writer.writerows(data)
+    os.replace(tmp_path, filepath)
     print(f"Saved {len(data)} rows -> {filepath}")
+    return True
 
 
 def parse_args():
@@ -87,11 +165,12 @@ def parse_args():
         description="Update school achievement/progression CSV files"
     )
     parser.add_argument(
-        "--area", default="11680", help="지역 코드 (예: 11=서울, 11680=강남구)"
+        "--area", nargs='+', default=["11680"],
+        help="지역 코드 (예: 11=서울, 11680=강남구), 여러 개 지정 가능"
     )
     parser.add_argument(
-        "--type", choices=["3", "4"], default="3",
-        help="학교 유형 (3=중학교, 4=고등학교)"
+        "--type", nargs='+', choices=["3", "4"], default=["3"],
+        help="학교 유형 (3=중학교, 4=고등학교), 여러 개 지정 가능"
     )
     parser.add_argument(
         "--metrics", nargs='+',
@@ -103,28 +182,120 @@ def parse_args():
         "--output-dir", default=".",
         help="CSV 파일을 저장할 디렉토리"
     )
+    parser.add_argument(
+        "--input-dir", default=None,
+        help="크롤링 대신 이 디렉토리의 scrap.py 결과(<metric>_<area>_<type>.csv)를 사용"
+    )
+    parser.add_argument(
+        "--report", default=None,
+        help="요청별 소요시간/바이트/행 수를 기록한 JSON 실행 리포트 경로"
+    )
+    parser.add_argument(
+        "--journal", default=None,
+        help="완료된 요청을 기록하는 저널 경로 (기본: <output-dir>/.update_csv_journal.jsonl)"
+    )
+    parser.add_argument(
+        "--single-pass", action="store_true",
+        help="지역마다 한 번만 요청하고 나머지 지표의 정렬은 로컬에서 계산"
+    )
+    parser.add_argument(
+        "--verify-ordering", action="store_true",
+        help="--single-pass로 계산한 정렬을 서버 정렬과 비교해 서버 결과를 저장하고, 다르면 리포트에 기록 (요청 수는 줄지 않음)"
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--resume", dest="force", action="store_false", default=False,
+        help="저널에 기록된 완료 요청은 건너뛰고 이어서 크롤링 (기본값)"
+    )
+    mode.add_argument(
+        "--force", dest="force", action="store_true",
+        help="저널을 무시하고 처음부터 다시 크롤링"
+    )
     return parser.parse_args()
 
 
 def main():
     args = parse_args()
+    stats = CrawlStats()
+    try:
+        update(args, stats)
+    finally:
+        # 실패한 실행도 원인 분석을 위해 리포트를 남김
+        if args.report:
+            report = stats.write_report(args.report)
+            print(f"Report ({report['totals']['requests']} requests) -> {args.report}")
+
+
+def update(args, stats: CrawlStats):
     # metrics별 order/orderby 매핑
     metric_map = {
         'achievement': ('1', 'desc'),  # 학업성취도 순
         'progression': ('7', 'desc'),   # 진학률 순
     }
 
-    for metric in args.metrics:
-        order, orderby = metric_map[metric]
-        data = fetch_school_list(
-            area=args.area,
-            type1=args.type,
-            order=order,
-            orderby=orderby,
-        )
-        filename = f"{metric}_{args.area}_{args.type}.csv"
-        filepath = os.path.join(args.output_dir, filename)
-        save_to_csv(data, filepath)
+    if args.input_dir:
+        rebuild_from_scraped(args)
+        return
+
+    journal = CrawlJournal(
+        args.journal or os.path.join(args.output_dir, '.update_csv_journal.jsonl')
+    )
+    if args.force:
+        journal.reset()
+    elif journal.entries:
+        print(f"Resuming: {len(journal.entries)} completed requests in {journal.path}")
+
+    for area in args.area:
+        for type1 in args.type:
+            payloads = {
+                metric: {'area': area, 'type1': type1,
+                         'order': metric_map[metric][0], 'orderby': metric_map[metric][1]}
+                for metric in args.metrics
+            }
+            pending = [m for m in args.metrics if not journal.is_done(payloads[m])]
+            if not pending:
+                continue
+            if args.single_pass:
+                by_order = fetch_school_lists(
+                    area=area,
+                    type1=type1,
+                    orders=[metric_map[m][0] for m in pending],
+                    orderby=metric_map[pending[0]][1],
+                    stats=stats,
+                    verify=args.verify_ordering,
+                )
+            else:
+                by_order = {
+                    metric_map[m][0]: fetch_school_list(
+                        area=area,
+                        type1=type1,
+                        order=metric_map[m][0],
+                        orderby=metric_map[m][1],
+                        stats=stats,
+                    )
+                    for m in pending
+                }
+            for metric in pending:
+                data = by_order[metric_map[metric][0]]
+                filename = f"{metric}_{area}_{type1}.csv"
+                filepath = os.path.join(args.output_dir, filename)
+                saved = save_to_csv(data, filepath)
+                journal.record(payloads[metric], filepath if saved else None, len(data))
+
+    # 모든 요청이 끝났으면 저널 삭제 (다음 실행은 처음부터)
+    journal.finish()
+
+
+def rebuild_from_scraped(args):
+    """scrap.py 결과 CSV로 출력 CSV를 다시 생성 (네트워크 요청 없음)"""
+    for area in args.area:
+        for type1 in args.type:
+            for metric in args.metrics:
+                filename = f"{metric}_{area}_{type1}.csv"
+                source = os.path.join(args.input_dir, filename)
+                if not os.path.exists(source):
+                    raise FileNotFoundError(f"scrap 결과 파일이 없습니다: {source}")
+                save_to_csv(load_scraped_csv(source), os.path.join(args.output_dir, filename))
 
 
 if __name__ == '__main__':
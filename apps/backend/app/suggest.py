@@ -0,0 +1,120 @@
+"""아파트명 자동완성을 위한 메모리 내 접두사(prefix) 인덱스
+
+지오코딩 결과 중 카카오가 아파트로 분류한 장소명(place_name)과 좌표를
+정렬된 배열에 보관하고,
+이진 탐색(bisect)으로 접두사가 일치하는 항목을 찾습니다.
+한글은 초성/중성/종성 자모로 분해해 비교하므로 입력 중인 글자
+("래ㅁ", "래미ㅇ" 등)로도 검색됩니다.
+"""
+import bisect
+import threading
+import unicodedata
+from typing import Dict, List, Tuple
+
+# 한글 음절 분해용 상수 (U+AC00 ~ U+D7A3)
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_JUNG_COUNT = 21
+_JONG_COUNT = 28
+_CHO = [chr(0x1100 + i) for i in range(19)]
+_JUNG = [chr(0x1161 + i) for i in range(21)]
+_JONG = [""] + [chr(0x11A8 + i) for i in range(27)]
+
+# 종성 -> 같은 소리의 초성 (입력 중 "램"이 "래미"의 접두사로 매칭되도록)
+# 호환 자모(ㄱ, ㅏ 등)는 NFKC 정규화 시 초성/중성 자모로 바뀜
+_JONG_TO_CHO = {}
+for _jong in _JONG[1:]:
+    try:
+        _JONG_TO_CHO[_jong] = unicodedata.lookup(
+            unicodedata.name(_jong).replace("JONGSEONG", "CHOSEONG"))
+    except KeyError:
+        # ㄳ, ㄺ 등 겹받침은 대응하는 초성이 없음
+        pass
+
+
+def _decompose(text: str) -> List[str]:
+    jamo: List[str] = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            offset = code - _HANGUL_BASE
+            jamo.append(_CHO[offset // (_JUNG_COUNT * _JONG_COUNT)])
+            jamo.append(_JUNG[(offset // _JONG_COUNT) % _JUNG_COUNT])
+            jong = _JONG[offset % _JONG_COUNT]
+            if jong:
+                jamo.append(jong)
+        else:
+            jamo.append(ch)
+    return jamo
+
+
+def normalize(text: str) -> str:
+    """검색용 키 생성: NFKC 정규화, 소문자화, 공백/구두점 제거, 한글 자모 분해"""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = "".join(ch for ch in text if ch.isalnum())
+    return "".join(_decompose(text))
+
+
+def _query_keys(query: str) -> List[str]:
+    """질의어의 검색 키 목록
+
+    마지막 글자의 종성은 아직 입력 중인 다음 글자의 초성일 수 있으므로
+    ("램" -> "래미"), 종성을 초성으로 바꾼 키도 함께 검색합니다.
+    """
+    key = normalize(query)
+    keys = [key]
+    if key and key[-1] in _JONG_TO_CHO:
+        keys.append(key[:-1] + _JONG_TO_CHO[key[-1]])
+    return keys
+
+
+class SuggestIndex:
+    """정렬된 정규화 키 배열 기반 접두사 인덱스
+
+    추가는 O(n) 삽입이지만 지오코딩 결과가 쌓이는 속도는 느리고,
+    조회는 O(log n + k)로 매 키 입력마다 호출되어도 충분히 빠릅니다.
+    정규화 키가 같은 이름("래미안 퍼스티지", "래미안퍼스티지")은
+    처음 추가된 이름 하나로 제안됩니다.
+    """
+
+    def __init__(self, max_entries: int = 100_000):
+        self.max_entries = max_entries
+        self._keys: List[str] = []
+        self._names: Dict[str, str] = {}
+        self._coords: Dict[str, Tuple[float, float]] = {}  # 정규화 키 -> 좌표
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, name: str, latitude: float, longitude: float) -> None:
+        """아파트명과 좌표를 인덱스에 추가 (이미 있으면 좌표만 갱신)"""
+        name = name.strip()
+        key = normalize(name)
+        if not key:
+            return
+        with self._lock:
+            if key not in self._names:
+                if len(self._keys) >= self.max_entries:
+                    return
+                bisect.insort(self._keys, key)
+                self._names[key] = name
+            self._coords[key] = (latitude, longitude)
+
+    def search(self, query: str, limit: int = 10) -> List[dict]:
+        """질의어로 시작하는 항목을 정규화 키 순서로 최대 limit개 반환"""
+        matches = set()
+        with self._lock:
+            for key in _query_keys(query):
+                if not key:
+                    continue
+                i = bisect.bisect_left(self._keys, key)
+                end = min(len(self._keys), i + limit)
+                while i < end and self._keys[i].startswith(key):
+                    matches.add(self._keys[i])
+                    i += 1
+            results = []
+            for key in sorted(matches)[:limit]:
+                lat, lon = self._coords[key]
+                results.append({"name": self._names[key], "latitude": lat, "longitude": lon})
+        return results
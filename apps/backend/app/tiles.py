@@ -0,0 +1,97 @@
+"""지도 화면용 고정 줌 타일 인덱스
+
+학교 데이터 스냅샷마다 모든 학교를 고정 줌(TILE_ZOOM)의 웹 메르카토르
+타일(z/x/y)로 나누어 두고, 타일별 JSON 본문과 ETag를 미리 만들어 둡니다.
+지도 이동 시에는 전체 학교를 훑는 대신 보이는 영역의 타일만 읽습니다.
+"""
+import hashlib
+import json
+import math
+from typing import Dict, Iterator, List, Tuple
+
+import pandas as pd
+
+# 줌 13 타일 한 변은 위도 37도 부근에서 약 3.9km
+TILE_ZOOM = 13
+# 한 번의 bbox 요청에서 읽을 수 있는 최대 타일 수
+MAX_BBOX_TILES = 400
+
+
+def latlon_to_tile(lat: float, lon: float, zoom: int = TILE_ZOOM) -> Tuple[int, int]:
+    """위도/경도를 타일 좌표(x, y)로 변환"""
+    n = 2 ** zoom
+    lat = max(min(lat, 85.05112878), -85.05112878)
+    x = int((lon + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def bbox_tiles(min_lat: float, min_lon: float, max_lat: float, max_lon: float,
+               zoom: int = TILE_ZOOM) -> Iterator[Tuple[int, int]]:
+    """bbox를 덮는 타일 좌표 (y축은 북쪽이 작음)"""
+    x0, y0 = latlon_to_tile(max_lat, min_lon, zoom)
+    x1, y1 = latlon_to_tile(min_lat, max_lon, zoom)
+    for x in range(x0, x1 + 1):
+        for y in range(y0, y1 + 1):
+            yield x, y
+
+
+def bbox_tile_count(min_lat: float, min_lon: float, max_lat: float, max_lon: float,
+                    zoom: int = TILE_ZOOM) -> int:
+    x0, y0 = latlon_to_tile(max_lat, min_lon, zoom)
+    x1, y1 = latlon_to_tile(min_lat, max_lon, zoom)
+    return (x1 - x0 + 1) * (y1 - y0 + 1)
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+class TileIndex:
+    """한 데이터 스냅샷에 대한 타일별 학교 목록, JSON 본문, ETag
+
+    타일 ETag는 타일 내용의 해시이므로 새 스냅샷에서도 내용이 같은
+    타일은 ETag가 유지되어 클라이언트 캐시가 그대로 유효합니다.
+    """
+
+    def __init__(self, df: pd.DataFrame, snapshot: str, zoom: int = TILE_ZOOM):
+        self.snapshot = snapshot
+        self.zoom = zoom
+        self.tiles: Dict[Tuple[int, int], List[dict]] = {}
+        for name, lat, lon, score in zip(df['학교명'], df['latitude'],
+                                         df['longitude'], df['performance_score']):
+            school = {
+                "학교명": str(name),
+                "latitude": float(lat),
+                "longitude": float(lon),
+                "performance_score": round(float(score), 1),
+            }
+            self.tiles.setdefault(latlon_to_tile(lat, lon, zoom), []).append(school)
+
+        self._bodies: Dict[Tuple[int, int], Tuple[bytes, str]] = {}
+        for (x, y), schools in self.tiles.items():
+            body = json.dumps(
+                {"z": zoom, "x": x, "y": y, "schools": schools},
+                ensure_ascii=False, separators=(",", ":"),
+            ).encode("utf-8")
+            self._bodies[(x, y)] = (body, _etag(body))
+
+    def tile(self, x: int, y: int) -> Tuple[bytes, str]:
+        """타일의 JSON 본문과 ETag (학교가 없는 타일은 빈 목록)"""
+        cached = self._bodies.get((x, y))
+        if cached is None:
+            body = json.dumps(
+                {"z": self.zoom, "x": x, "y": y, "schools": []}, separators=(",", ":")
+            ).encode("utf-8")
+            cached = (body, _etag(body))
+        return cached
+
+    def bbox(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> List[dict]:
+        """bbox 안의 학교 목록 (덮는 타일만 확인)"""
+        schools = []
+        for key in bbox_tiles(min_lat, min_lon, max_lat, max_lon, self.zoom):
+            for school in self.tiles.get(key, ()):
+                if (min_lat <= school["latitude"] <= max_lat
+                        and min_lon <= school["longitude"] <= max_lon):
+                    schools.append(school)
+        return schools
@@ -0,0 +1,150 @@
+"""CPU 작업용 워커 풀과 입장(admission) 제한
+
+이벤트 루프를 막지 않도록 CPU를 많이 쓰는 작업(pandas 로드, 거리 계산,
+정렬, 응답 생성)을 고정 크기 스레드 풀에서 실행합니다.
+제한은 두 가지입니다.
+
+- 워커 풀: 실행 중 + 워커를 기다리는 작업이 workers + max_queue를 넘으면 거절
+- 처리 중 요청: admit()으로 핸들러 시작부터 응답까지 센 요청 수가
+  max_inflight를 넘으면 거절 (지오코딩 등 I/O 대기 요청이 끝없이 쌓이지 않도록)
+
+한도를 넘으면 바로 PoolOverloaded 를 발생시켜 지연시간이 끝없이 늘어나는
+대신 빠르게 거절(503 + Retry-After)할 수 있게 합니다.
+
+스레드 풀이므로 pandas/numpy 연산 중 GIL을 놓지 않는 부분은 워커 수를 늘려도
+병렬로 실행되지 않습니다. 워커 풀은 이벤트 루프를 막지 않고 과부하 시 빨리
+거절하기 위한 것이며, 작업 자체는 가능한 한 벡터화해 짧게 유지해야 합니다.
+"""
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Deque, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class PoolOverloaded(Exception):
+    """대기열이 가득 차 작업을 받을 수 없음"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"worker pool is full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class AdmissionPool:
+    """크기가 고정된 워커 풀 + 제한된 대기열
+
+    pending(워커 풀에 제출된 작업: 대기 중 + 실행 중)과 in_flight(처리 중인
+    요청) 카운터는 이벤트 루프에서만 바뀌므로 잠금이 필요 없고, running 및 통계
+    값은 워커 스레드에서도 바뀌므로 잠금을 사용합니다.
+    """
+
+    def __init__(self, workers: int, max_queue: int, max_inflight: int = 256,
+                 window: int = 1000):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_inflight = max_inflight
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="search")
+        self._pending = 0
+        self._inflight = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        # 최근 작업들의 대기시간/실행시간 (초)
+        self._waits: Deque[float] = deque(maxlen=window)
+        self._services: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def retry_after(self) -> int:
+        """현재 대기열이 비워질 때까지 예상 시간(초, 최소 1)"""
+        with self._lock:
+            services = list(self._services)
+        avg = sum(services) / len(services) if services else 0.0
+        return max(1, math.ceil(avg * self._pending / self.workers))
+
+    def _reject(self) -> None:
+        with self._lock:
+            self._rejected += 1
+        raise PoolOverloaded(self.retry_after())
+
+    def check(self) -> None:
+        """워커 풀 대기열이 가득 찼으면 PoolOverloaded (작업 제출 전 빠른 거절용)"""
+        if self._pending >= self.workers + self.max_queue:
+            self._reject()
+
+    @contextmanager
+    def admit(self) -> Iterator[None]:
+        """요청 처리 전체(지오코딩 대기 포함)를 처리 중 요청 한 건으로 계산
+
+        처리 중 요청이 max_inflight개이거나 워커 풀 대기열이 가득 찼으면
+        PoolOverloaded. 워커 풀 자리는 차지하지 않습니다.
+        """
+        if self._inflight >= self.max_inflight:
+            self._reject()
+        self.check()
+        self._inflight += 1
+        try:
+            yield
+        finally:
+            self._inflight -= 1
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """fn(*args)를 워커 풀에서 실행, 대기열이 가득 차면 PoolOverloaded"""
+        self.check()
+
+        submitted = time.perf_counter()
+
+        def task():
+            started = time.perf_counter()
+            with self._lock:
+                self._running += 1
+                self._waits.append(started - submitted)
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+                    self._services.append(time.perf_counter() - started)
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, task)
+        finally:
+            self._pending -= 1
+
+    def stats(self) -> dict:
+        """오토스케일링 판단용 지표"""
+        with self._lock:
+            waits = sorted(self._waits)
+            services = sorted(self._services)
+            running = self._running
+            completed = self._completed
+            rejected = self._rejected
+
+        def pct(values, p):
+            if not values:
+                return 0.0
+            return round(values[min(len(values) - 1, math.ceil(p / 100 * len(values)) - 1)] * 1000, 2)
+
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "max_in_flight": self.max_inflight,
+            "in_flight": self._inflight,
+            "running": running,
+            # 워커를 기다리는 작업 수 (지오코딩 중인 요청은 포함하지 않음)
+            "queued": max(0, self._pending - running),
+            "completed_total": completed,
+            "rejected_total": rejected,
+            "queue_wait_ms": {"p50": pct(waits, 50), "p95": pct(waits, 95), "max": pct(waits, 100)},
+            "service_ms": {"p50": pct(services, 50), "p95": pct(services, 95), "max": pct(services, 100)},
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
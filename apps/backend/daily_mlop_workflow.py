@@ -1,10 +1,33 @@
 # ~/airflow/dags/daily_mlop_workflow.py
-# 매일 스크랩, CSV 업데이트 후 정보 수집 및 표시 스크립트 실행
+# 매일 시/도별로 병렬 스크랩 후 결과를 병합하고, 데이터가 바뀐 경우에만
+# CSV 업데이트 및 정보 수집/표시 스크립트 실행
 
 from airflow import DAG
+from airflow.decorators import task
 from airflow.operators.bash import BashOperator
 from datetime import datetime, timedelta
+import glob
+import json
 import os
+import sys
+
+# 스크립트(scrap.py, asil_crawler.py 등)가 위치한 디렉토리
+MLOPS_DIR = os.path.expanduser("~/mlops")
+# 시/도별 스크랩 결과 및 병합 결과가 저장되는 디렉토리
+DATA_DIR = os.path.join(MLOPS_DIR, "data")
+# 날짜별 크롤링 실행 리포트 보관 디렉토리
+REPORT_DIR = os.path.join(DATA_DIR, "reports")
+# 마지막으로 처리한 데이터의 지문(fingerprint) 저장 파일
+FINGERPRINT_PATH = os.path.join(DATA_DIR, "fingerprint.json")
+# 동시에 실행할 시/도별 크롤링 태스크 수 (워커 수에 맞게 조정)
+CRAWL_CONCURRENCY = int(os.getenv("ASIL_CRAWL_CONCURRENCY", "8"))
+# 스크랩할 지표
+METRICS = ["achievement", "progression"]
+
+VENV_PREFIX = (
+    "cd ~/mlops && "
+    "source ~/airflow-venv/bin/activate && "
+)
 
 # 기본 인수 설정
 default_args = {
@@ -16,45 +39,142 @@ default_args = {
     'retry_delay': timedelta(minutes=10),
 }
 
+
+def _read_fingerprint():
+    try:
+        with open(FINGERPRINT_PATH, encoding="utf-8") as f:
+            return json.load(f).get("fingerprint")
+    except (OSError, ValueError):
+        return None
+
+
 with DAG(
     dag_id='daily_mlop_workflow',
     default_args=default_args,
-    description='매일 scrap, update_csv 및 정보 표시(main.py) 순차 실행',
+    description='매일 시/도별 scrap 병렬 실행 후 병합, 변경 시에만 update_csv 및 정보 표시(main.py) 실행',
     start_date=datetime(2025, 8, 6),
     schedule_interval='@daily',
     catchup=False,
     max_active_runs=1,
 ) as dag:
 
-    # 1) scrap.py 실행: 웹 크롤링 등을 수행하여 원시 데이터 확보
-    run_scrap = BashOperator(
-        task_id='run_scrap',
+    # 1) 시/도 코드 목록 조회: 동적 태스크 매핑의 입력
+    #    매 실행마다 시/도 하나(날짜별로 순환)는 로컬 정렬을 서버 정렬과 비교
+    #    (불일치는 실행 리포트에 기록되고 해당 시/도는 서버 정렬로 저장)
+    @task
+    def list_provinces(ds=None):
+        sys.path.insert(0, MLOPS_DIR)
+        from asil_crawler import AsilCrawler
+
+        provinces = AsilCrawler().get_province_codes()
+        # '' / '00'(전국) 항목은 시/도별 결과와 중복되므로 제외
+        codes = [code for code in sorted(provinces) if code and code != "00"]
+        verify_index = datetime.strptime(ds, "%Y-%m-%d").toordinal() % len(codes)
+        return [
+            {"AREA": code, "VERIFY_ORDERING": "1" if i == verify_index else ""}
+            for i, code in enumerate(codes)
+        ]
+
+    # 2) scrap.py 실행 (시/도별 매핑): 실패한 시/도만 개별 재시도하며,
+    #    재시도 시에는 출력 디렉토리의 크롤링 저널로 완료된 요청을 건너뜀
+    crawl_province = BashOperator.partial(
+        task_id='crawl_province',
         bash_command=(
-            "cd ~/mlops && "
-            "source ~/airflow-venv/bin/activate && "
-            "python scrap.py"
+            VENV_PREFIX
+            + "python scrap.py --area \"$AREA\" "
+            + "--metrics " + " ".join(METRICS) + " --single-pass "
+            + "${VERIFY_ORDERING:+--verify-ordering} "
+            + "--output-dir data/{{ ds }}/provinces/\"$AREA\" "
+            + "--report data/{{ ds }}/reports/crawl_\"$AREA\".json"
         ),
-    )
+        append_env=True,
+        max_active_tis_per_dagrun=CRAWL_CONCURRENCY,
+    ).expand(env=list_provinces())
+
+    # 2-1) 시/도별 실행 리포트를 합쳐 날짜별로 보관하고 직전 실행과 비교
+    #      (일부 시/도가 실패해도 리포트는 남김)
+    @task(trigger_rule="all_done")
+    def archive_crawl_report(ds=None):
+        sys.path.insert(0, MLOPS_DIR)
+        from asil_crawler import CrawlStats
 
-    # 2) update_csv.py 실행: scrap 결과를 가공해 middle_schools.csv 생성
+        paths = sorted(glob.glob(os.path.join(DATA_DIR, ds, "reports", "crawl_*.json")))
+        archive_path = os.path.join(REPORT_DIR, f"crawl_{ds}.json")
+        previous = sorted(
+            p for p in glob.glob(os.path.join(REPORT_DIR, "crawl_*.json"))
+            if p != archive_path
+        )
+        report = CrawlStats.from_reports(paths).write_report(archive_path)
+        totals = report["totals"]
+        print(f"Archived crawl report ({len(paths)} areas) -> {archive_path}")
+        # 로컬 정렬 검증 결과 (불일치해도 서버 정렬로 저장되었으므로 실패시키지 않음)
+        for mismatch in report["ordering_mismatches"]:
+            print(f"WARNING: derived order={mismatch['order']} differs from the server "
+                  f"for area {mismatch['area']}: {'; '.join(mismatch['problems'])}")
+
+        if previous:
+            with open(previous[-1], encoding="utf-8") as f:
+                prev_totals = json.load(f)["totals"]
+            for key in ("requests", "errors", "small_responses", "bytes", "rows",
+                        "fetch_seconds", "parse_seconds", "max_fetch_seconds"):
+                print(f"{key}: {prev_totals.get(key)} -> {totals.get(key)}")
+        return totals
+
+    # 3) 시/도별 결과 병합(지표 기준 전국 순위로 다시 정렬) 및 지문 계산
+    #    (지문은 날짜와 무관하게 시/도별 파일의 상대 경로와 내용으로 계산)
+    @task
+    def merge_results(ds=None):
+        sys.path.insert(0, MLOPS_DIR)
+        from crawl_merge import compute_fingerprint, merge_province_csvs
+
+        run_dir = os.path.join(DATA_DIR, ds)
+        for merged_path in merge_province_csvs(run_dir):
+            print(f"Merged -> {merged_path}")
+        return compute_fingerprint(run_dir)
+
+    # 4) 지문 비교: 변경이 없으면 이후 단계를 모두 건너뜀
+    @task.short_circuit
+    def detect_changes(fingerprint):
+        previous = _read_fingerprint()
+        if previous == fingerprint:
+            print(f"No changes since last run (fingerprint={fingerprint[:12]}).")
+            return False
+        print(f"Data changed: {previous and previous[:12]} -> {fingerprint[:12]}")
+        return True
+
+    # 5) update_csv.py 실행: 다시 크롤링하지 않고 병합된 scrap 결과
+    #    (data/{ds}/<metric>_all_<type>.csv)로 data/latest 의 CSV를 갱신
     run_update_csv = BashOperator(
         task_id='run_update_csv',
         bash_command=(
-            "cd ~/mlops && "
-            "source ~/airflow-venv/bin/activate && "
-            "python update_csv.py"
+            VENV_PREFIX
+            + "python update_csv.py --input-dir data/{{ ds }} --area all "
+            + "--metrics " + " ".join(METRICS) + " "
+            + "--output-dir data/latest"
         ),
     )
 
-    # 3) main.py 실행: front-end 연동용 정보 수집 및 표시
+    # 6) main.py 실행: front-end 연동용 정보 수집 및 표시
     run_main = BashOperator(
         task_id='run_main',
-        bash_command=(
-            "cd ~/mlops && "
-            "source ~/airflow-venv/bin/activate && "
-            "python main.py"
-        ),
+        bash_command=VENV_PREFIX + "python main.py",
     )
 
+    # 7) 모든 단계가 성공한 뒤에만 지문 저장 (실패 시 다음 실행에서 재처리)
+    @task
+    def record_fingerprint(fingerprint, ds=None):
+        os.makedirs(DATA_DIR, exist_ok=True)
+        tmp_path = FINGERPRINT_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": fingerprint, "ds": ds}, f)
+        os.replace(tmp_path, FINGERPRINT_PATH)
+
     # 작업 순서 정의
-    run_scrap >> run_update_csv >> run_main
+    fingerprint = merge_results()
+    crawl_province >> [fingerprint, archive_crawl_report()]
+    (
+        detect_changes(fingerprint)
+        >> run_update_csv
+        >> run_main
+        >> record_fingerprint(fingerprint)
+    )
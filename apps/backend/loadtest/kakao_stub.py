@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+kakao_stub.py
+
+dapi.kakao.com/v2/local/search/keyword.json 을 흉내내는 로컬 stub 서버.
+네트워크 없이 부하 테스트를 하기 위해 사용하며, 응답 지연(latency)과
+검색 실패 비율을 설정할 수 있습니다.
+
+    python loadtest/kakao_stub.py --port 8765 --latency-ms 40 --jitter-ms 20
+
+백엔드는 KAKAO_API_URL 환경변수로 이 서버를 바라보게 합니다.
+
+    KAKAO_API_URL=http://127.0.0.1:8765/v2/local/search/keyword.json
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+KEYWORD_PATH = "/v2/local/search/keyword.json"
+# 서울시청 기준, 아파트 좌표를 이 주변 약 ±5km 범위에 배치
+CENTER_LAT, CENTER_LON = 37.5665, 126.9780
+SPREAD_DEG = 0.045
+
+
+def fake_coordinates(query: str) -> tuple:
+    """질의어로부터 항상 같은 (위도, 경도)를 만들어 냄"""
+    digest = hashlib.sha256(query.encode("utf-8")).digest()
+    dy = int.from_bytes(digest[:4], "big") / 0xFFFFFFFF * 2 - 1
+    dx = int.from_bytes(digest[4:8], "big") / 0xFFFFFFFF * 2 - 1
+    return CENTER_LAT + dy * SPREAD_DEG, CENTER_LON + dx * SPREAD_DEG
+
+
+class KakaoStubHandler(BaseHTTPRequestHandler):
+    # 서버 인스턴스에서 설정값을 읽음
+    server: "KakaoStubServer"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != KEYWORD_PATH:
+            self._send_json(404, {"errorType": "NotFound", "message": url.path})
+            return
+        if not self.headers.get("Authorization", "").startswith("KakaoAK "):
+            self._send_json(401, {"errorType": "AccessDeniedError", "message": "no key"})
+            return
+
+        query = parse_qs(url.query).get("query", [""])[0]
+        self.server.sleep()
+        if not query or self.server.rng_random() < self.server.not_found_rate:
+            documents = []
+        else:
+            lat, lon = fake_coordinates(query)
+            documents = [{
+                "place_name": query,
+                "address_name": "서울 중구",
+                "category_name": "부동산 > 주거시설 > 아파트",
+                "x": f"{lon:.7f}",
+                "y": f"{lat:.7f}",
+            }]
+        self._send_json(200, {
+            "documents": documents,
+            "meta": {"total_count": len(documents), "pageable_count": len(documents),
+                     "is_end": True},
+        })
+
+    def _send_json(self, status: int, body: dict):
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # 부하 테스트 중 요청마다 로그를 남기지 않음
+        pass
+
+
+class KakaoStubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, address, latency_ms=0.0, jitter_ms=0.0, not_found_rate=0.0, seed=None):
+        super().__init__(address, KakaoStubHandler)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.not_found_rate = not_found_rate
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    def rng_random(self) -> float:
+        with self._rng_lock:
+            return self._rng.random()
+
+    def sleep(self):
+        """설정된 지연(latency ± jitter)만큼 대기"""
+        delay = self.latency_ms + (self.rng_random() * 2 - 1) * self.jitter_ms
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Local stub of the Kakao keyword search API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="평균 응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=10.0, help="지연 편차 (ms)")
+    parser.add_argument("--not-found-rate", type=float, default=0.0,
+                        help="검색 결과 없음으로 응답할 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    server = KakaoStubServer((args.host, args.port), args.latency_ms, args.jitter_ms,
+                             args.not_found_rate, args.seed)
+    print(f"Kakao stub listening on http://{args.host}:{args.port}{KEYWORD_PATH}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
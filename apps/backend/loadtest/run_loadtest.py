@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+run_loadtest.py
+
+/search-schools 엔드포인트 부하 테스트 도구.
+로컬 Kakao stub 서버(kakao_stub.py)와 백엔드(uvicorn)를 띄운 뒤,
+아파트명·반경·정렬 기준을 섞은 요청을 지정한 동시성으로 보내고
+처리량(req/s), 지연시간 백분위(p50/p90/p95/p99), 오류율을 출력합니다.
+네트워크 접근 없이 한 대의 Linux 머신에서 실행됩니다.
+
+    cd apps/backend
+    python loadtest/run_loadtest.py --concurrency 1 8 32 --duration 20
+
+이미 떠 있는 서버를 대상으로 하려면 --target 을 지정합니다.
+(이 경우 kakao_stub.py 를 따로 실행하고, 서버의 KAKAO_API_URL 이
+그 stub 서버를 가리켜야 합니다.)
+
+    python loadtest/run_loadtest.py --target http://127.0.0.1:8000 --no-stub
+
+학교 데이터는 --data 로 지정하고, 지정하지 않으면 apps/backend/middle_schools.csv,
+그것도 없으면 stub 좌표 주변에 합성 데이터(--synthetic-schools 개)를 만들어 씁니다.
+백엔드가 3개짜리 샘플 데이터로 동작 중이거나 /data/status 로 확인할 수 없으면
+측정하지 않고 중단합니다.
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from kakao_stub import CENTER_LAT, CENTER_LON, KEYWORD_PATH, KakaoStubServer  # noqa: E402
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DATA_PATH = os.path.join(BACKEND_DIR, "middle_schools.csv")
+# 합성 학교 데이터를 배치할 범위 (stub 아파트 좌표 범위보다 넓게, 약 ±13km)
+SYNTHETIC_SPREAD_DEG = 0.12
+
+# 요청 구성: (값, 가중치)
+APARTMENTS = [
+    "헬리오시티", "래미안퍼스티지", "롯데캐슬", "아크로리버파크", "은마아파트",
+    "잠실엘스", "리센츠", "트리지움", "파크리오", "반포자이",
+    "도곡렉슬", "타워팰리스", "목동신시가지7단지", "상계주공", "마포래미안푸르지오",
+    "경희궁자이", "고덕그라시움", "올림픽파크포레온", "DMC파크뷰자이", "한가람",
+]
+RADII = [(1.0, 2), (2.0, 3), (3.0, 10), (5.0, 2)]
+SORT_BY = [("distance", 7), ("performance", 3)]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def weighted(rng: random.Random, choices):
+    values, weights = zip(*choices)
+    return rng.choices(values, weights=weights)[0]
+
+
+def apartment_pool(size: int) -> list:
+    """요청에 쓸 아파트명 목록 (APARTMENTS 뒤에 "<이름> <n>단지"를 붙여 size개로 확장)
+
+    이름 수가 적으면 백엔드의 지오코딩 캐시에 금방 모두 들어가
+    Kakao API(stub) 지연이 측정에 반영되지 않습니다.
+    """
+    pool = APARTMENTS[:size]
+    n = 2
+    while len(pool) < size:
+        pool.extend(f"{name} {n}단지" for name in APARTMENTS[:size - len(pool)])
+        n += 1
+    return pool
+
+
+def write_synthetic_schools(path: str, count: int, seed: int):
+    """stub 좌표 주변에 무작위 학교 count개를 middle_schools.csv 형식으로 저장"""
+    rng = random.Random(seed)
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(["학교명", "학업성취도", "X좌표(경도)", "Y좌표(위도)"])
+        for i in range(count):
+            writer.writerow([
+                f"합성중학교{i + 1}",
+                round(rng.uniform(60.0, 100.0), 1),
+                round(CENTER_LON + rng.uniform(-1, 1) * SYNTHETIC_SPREAD_DEG, 7),
+                round(CENTER_LAT + rng.uniform(-1, 1) * SYNTHETIC_SPREAD_DEG, 7),
+            ])
+
+
+def check_school_data(target: str):
+    """백엔드가 샘플 데이터(학교 3개)로 떨어졌거나 확인할 수 없으면 측정을 중단"""
+    try:
+        res = requests.get(f"{target}/data/status", timeout=5)
+        res.raise_for_status()
+        status = res.json()
+    except (requests.RequestException, ValueError) as err:
+        raise SystemExit(
+            f"Cannot read school data status from {target}/data/status ({err}). "
+            "Pass --allow-sample to measure anyway."
+        )
+    if status.get("sample"):
+        raise SystemExit(
+            f"Backend is serving the 3-school sample dataset ({status.get('path')} not loaded). "
+            "Pass --data PATH, or --allow-sample to measure anyway."
+        )
+    print(f"School data on server: {status.get('schools')} schools ({status.get('path')})")
+
+
+def make_params(rng: random.Random, apartments: list) -> dict:
+    # 인기 단지에 요청이 몰리도록 Zipf 형태의 가중치 사용
+    apartment = rng.choices(apartments, weights=[1 / (i + 1) for i in range(len(apartments))])[0]
+    return {
+        "apartment": apartment,
+        "radius": weighted(rng, RADII),
+        "sort_by": weighted(rng, SORT_BY),
+    }
+
+
+def percentile(sorted_values, pct: float) -> float:
+    """nearest-rank 방식 백분위"""
+    if not sorted_values:
+        return float("nan")
+    k = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+def wait_until_ready(url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(url, timeout=1).status_code < 500:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server did not become ready: {url}")
+
+
+def run_level(target: str, concurrency: int, duration: float, warmup: float,
+              timeout: float, seed: int, apartments: list) -> dict:
+    """주어진 동시성으로 duration 초 동안 closed-loop 부하를 보냄"""
+    url = f"{target}/search-schools"
+    start = time.monotonic()
+    measure_from = start + warmup
+    stop_at = measure_from + duration
+    latencies = []
+    statuses = Counter()
+    lock = threading.Lock()
+
+    def worker(idx: int):
+        rng = random.Random(seed * 1000 + idx)
+        session = requests.Session()
+        local_lat, local_status = [], Counter()
+        while True:
+            now = time.monotonic()
+            if now >= stop_at:
+                break
+            params = make_params(rng, apartments)
+            t0 = time.perf_counter()
+            try:
+                status = str(session.get(url, params=params, timeout=timeout).status_code)
+            except requests.Timeout:
+                status = "timeout"
+            except requests.RequestException:
+                status = "conn_error"
+            elapsed = time.perf_counter() - t0
+            if now >= measure_from:
+                local_lat.append(elapsed)
+                local_status[status] += 1
+        with lock:
+            latencies.extend(local_lat)
+            statuses.update(local_status)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for i in range(concurrency):
+            pool.submit(worker, i)
+
+    latencies.sort()
+    total = sum(statuses.values())
+    errors = total - statuses.get("200", 0)
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        "throughput_rps": round(total / duration, 2),
+        "error_rate": round(errors / total, 4) if total else None,
+        "status_counts": dict(statuses),
+        "latency_ms": {
+            name: round(percentile(latencies, pct) * 1000, 2)
+            for name, pct in (("p50", 50), ("p90", 90), ("p95", 95), ("p99", 99), ("max", 100))
+        },
+    }
+
+
+def print_table(results):
+    header = f"{'conc':>5} {'reqs':>7} {'rps':>9} {'err%':>6} {'p50':>8} {'p90':>8} {'p95':>8} {'p99':>8} {'max':>8}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        lat = r["latency_ms"]
+        err = (r["error_rate"] or 0) * 100
+        print(f"{r['concurrency']:>5} {r['requests']:>7} {r['throughput_rps']:>9.1f} {err:>6.2f} "
+              f"{lat['p50']:>8.1f} {lat['p90']:>8.1f} {lat['p95']:>8.1f} {lat['p99']:>8.1f} {lat['max']:>8.1f}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load test for /search-schools")
+    parser.add_argument("--target", default=None,
+                        help="부하를 보낼 백엔드 주소 (미지정 시 uvicorn을 직접 실행)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16],
+                        help="동시 요청 수 (여러 개 지정 시 차례로 측정)")
+    parser.add_argument("--duration", type=float, default=15.0, help="동시성 단계별 측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="측정 전 워밍업 시간(초)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="요청 타임아웃(초)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 프로세스 수")
+    parser.add_argument("--no-stub", action="store_true", help="Kakao stub 서버를 띄우지 않음")
+    parser.add_argument("--stub-latency-ms", type=float, default=30.0)
+    parser.add_argument("--stub-jitter-ms", type=float, default=10.0)
+    parser.add_argument("--stub-not-found-rate", type=float, default=0.0)
+    parser.add_argument("--data", default=None,
+                        help="백엔드가 사용할 학교 CSV (미지정 시 middle_schools.csv, 없으면 합성 데이터)")
+    parser.add_argument("--synthetic-schools", type=int, default=3000,
+                        help="합성 학교 데이터의 학교 수")
+    parser.add_argument("--allow-sample", action="store_true",
+                        help="백엔드가 샘플 데이터로 동작 중이어도 측정")
+    parser.add_argument("--apartments", type=int, default=1000,
+                        help="요청에 섞을 아파트명 수 (기본 이름 목록을 n단지로 확장)")
+    parser.add_argument("--no-geocode-cache", action="store_true",
+                        help="백엔드 지오코딩 캐시를 끄고 매 요청 Kakao API(stub)를 호출 (GEOCODE_CACHE_SIZE=0)")
+    parser.add_argument("--json-out", default=None, help="결과를 저장할 JSON 파일 경로")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    stub = backend = None
+    env = dict(os.environ)
+    apartments = apartment_pool(args.apartments)
+    workdir = tempfile.TemporaryDirectory(prefix="loadtest-")
+
+    try:
+        if not args.no_stub:
+            stub_port = free_port()
+            stub = KakaoStubServer(("127.0.0.1", stub_port), args.stub_latency_ms,
+                                   args.stub_jitter_ms, args.stub_not_found_rate, args.seed)
+            threading.Thread(target=stub.serve_forever, daemon=True).start()
+            env["KAKAO_API_URL"] = f"http://127.0.0.1:{stub_port}{KEYWORD_PATH}"
+            env.setdefault("KAKAO_REST_API_KEY", "loadtest")
+            print(f"Kakao stub: {env['KAKAO_API_URL']} "
+                  f"(latency {args.stub_latency_ms}±{args.stub_jitter_ms} ms)")
+
+        target = args.target
+        if target is None:
+            data_path = args.data
+            if data_path is None and os.path.exists(DEFAULT_DATA_PATH):
+                data_path = DEFAULT_DATA_PATH
+            if data_path is None:
+                data_path = os.path.join(workdir.name, "synthetic_schools.csv")
+                write_synthetic_schools(data_path, args.synthetic_schools, args.seed)
+                print(f"School data: {args.synthetic_schools} synthetic schools")
+            else:
+                print(f"School data: {data_path}")
+            env["SCHOOL_DATA_PATH"] = os.path.abspath(data_path)
+            if args.no_geocode_cache:
+                env["GEOCODE_CACHE_SIZE"] = "0"
+            port = free_port()
+            backend = subprocess.Popen(
+                [sys.executable, "-m", "uvicorn", "app.main:app",
+                 "--host", "127.0.0.1", "--port", str(port),
+                 "--workers", str(args.workers), "--log-level", "warning"],
+                cwd=BACKEND_DIR, env=env,
+            )
+            target = f"http://127.0.0.1:{port}"
+        target = target.rstrip("/")
+        wait_until_ready(f"{target}/docs")
+        if not args.allow_sample:
+            check_school_data(target)
+        print(f"Target: {target} ({len(apartments)} apartment names)\n")
+
+        results = []
+        for concurrency in args.concurrency:
+            results.append(run_level(target, concurrency, args.duration, args.warmup,
+                                     args.timeout, args.seed, apartments))
+        print_table(results)
+
+        if args.json_out:
+            with open(args.json_out, "w", encoding="utf-8") as f:
+                json.dump({"target": target, "duration_s": args.duration, "results": results},
+                          f, ensure_ascii=False, indent=2)
+            print(f"\nSaved results -> {args.json_out}")
+    finally:
+        if backend is not None:
+            backend.terminate()
+            backend.wait(timeout=10)
+        if stub is not None:
+            stub.shutdown()
+            stub.server_close()
+        workdir.cleanup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+import os
+
+from crawl_journal import CrawlJournal
+
+PAYLOADS = [
+    {"area": "11680", "type1": "3", "order": order, "orderby": "desc"}
+    for order in ("1", "7")
+]
+
+
+def write_output(tmp_path, name, text):
+    path = str(tmp_path / name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+
+def test_resume_skips_recorded_payloads_with_intact_output(tmp_path):
+    journal_path = str(tmp_path / ".crawl_journal.jsonl")
+    output = write_output(tmp_path, "achievement.csv", "a,b\n1,2\n")
+    CrawlJournal(journal_path).record(PAYLOADS[0], output, 1)
+
+    resumed = CrawlJournal(journal_path)
+    assert resumed.is_done(PAYLOADS[0])
+    assert not resumed.is_done(PAYLOADS[1])
+
+    # 출력 파일이 바뀌면 다시 크롤링
+    write_output(tmp_path, "achievement.csv", "a,b\n9,9\n")
+    assert not CrawlJournal(journal_path).is_done(PAYLOADS[0])
+
+
+def test_empty_result_counts_as_done(tmp_path):
+    journal_path = str(tmp_path / "journal.jsonl")
+    CrawlJournal(journal_path).record(PAYLOADS[0], None, 0)
+    assert CrawlJournal(journal_path).is_done(PAYLOADS[0])
+
+
+def test_torn_trailing_line_is_truncated_and_next_record_survives(tmp_path):
+    journal_path = str(tmp_path / "journal.jsonl")
+    output = write_output(tmp_path, "achievement.csv", "a\n1\n")
+    CrawlJournal(journal_path).record(PAYLOADS[0], output, 1)
+    with open(journal_path, "a", encoding="utf-8") as f:
+        f.write('{"key": "torn')
+
+    journal = CrawlJournal(journal_path)
+    assert journal.is_done(PAYLOADS[0])
+    with open(journal_path, "rb") as f:
+        assert f.read().endswith(b"\n")
+
+    journal.record(PAYLOADS[1], None, 0)
+    reloaded = CrawlJournal(journal_path)
+    assert reloaded.is_done(PAYLOADS[0])
+    assert reloaded.is_done(PAYLOADS[1])
+
+
+def test_finish_removes_journal(tmp_path):
+    journal_path = str(tmp_path / "journal.jsonl")
+    journal = CrawlJournal(journal_path)
+    journal.record(PAYLOADS[0], None, 0)
+    journal.finish()
+    assert not os.path.exists(journal_path)
+    assert not CrawlJournal(journal_path).is_done(PAYLOADS[0])
+
+
+def test_lines_without_key_are_skipped(tmp_path):
+    journal_path = str(tmp_path / "journal.jsonl")
+    with open(journal_path, "w", encoding="utf-8") as f:
+        f.write('{"payload": {}}\n[1, 2]\n')
+    journal = CrawlJournal(journal_path)
+    assert journal.entries == {}
+    journal.record(PAYLOADS[0], None, 0)
+    assert CrawlJournal(journal_path).is_done(PAYLOADS[0])
+
+
+def test_update_csv_ignores_interrupted_scrap_journal(tmp_path, monkeypatch):
+    import update_csv
+    from asil_crawler import CrawlStats
+
+    # scrap.py가 같은 출력 디렉토리에서 중단되어 저널과 출력 파일을 남김
+    payload = {"area": "11680", "type1": "3", "order": "1", "orderby": "desc"}
+    scrap_output = write_output(tmp_path, "achievement_11680_3.csv", "scrap\n")
+    scrap_journal = CrawlJournal(str(tmp_path / ".scrap_journal.jsonl"))
+    scrap_journal.record(payload, scrap_output, 1)
+
+    calls = []
+
+    def fetch(area, type1, order, orderby, stats=None):
+        calls.append(order)
+        return [{"rank": "1", "school_name": "가중", "average": "90"}]
+
+    monkeypatch.setattr(update_csv, "fetch_school_list", fetch)
+    monkeypatch.setattr("sys.argv", ["update_csv.py", "--output-dir", str(tmp_path)])
+    update_csv.update(update_csv.parse_args(), CrawlStats())
+
+    assert calls == ["1"]
+    with open(scrap_output, encoding="utf-8-sig") as f:
+        assert "가중" in f.read()
+    # scrap.py의 재개 상태는 그대로 남음
+    assert os.path.exists(scrap_journal.path)
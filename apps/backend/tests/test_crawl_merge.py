@@ -0,0 +1,70 @@
+import csv
+import os
+
+import pytest
+
+from crawl_merge import compute_fingerprint, merge_province_csvs
+from update_csv import load_scraped_csv
+
+
+def write_csv(path, rows):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def make_run(data_dir, ds, area_rows):
+    run_dir = os.path.join(data_dir, ds)
+    for area, rows in area_rows.items():
+        write_csv(os.path.join(run_dir, "provinces", area, f"achievement_{area}_3.csv"), rows)
+    return run_dir
+
+
+ROWS = {
+    "11": [{"school_name": "가중", "average": "90.1", "special_rate": "3.2%"}],
+    "26": [{"school_name": "나중", "average": "88.0", "special_rate": "-"}],
+}
+
+
+def test_fingerprint_same_for_identical_runs_on_different_dates(tmp_path):
+    first = make_run(str(tmp_path), "2025-08-07", ROWS)
+    second = make_run(str(tmp_path), "2025-08-08", ROWS)
+    assert compute_fingerprint(first) == compute_fingerprint(second)
+
+
+def test_fingerprint_changes_with_content(tmp_path):
+    first = make_run(str(tmp_path), "2025-08-07", ROWS)
+    changed = dict(ROWS, **{"26": [{"school_name": "나중", "average": "88.5", "special_rate": "-"}]})
+    second = make_run(str(tmp_path), "2025-08-08", changed)
+    assert compute_fingerprint(first) != compute_fingerprint(second)
+
+
+def test_merge_reranks_rows_nationwide_and_rebuild_renames_columns(tmp_path):
+    run_dir = make_run(str(tmp_path), "2025-08-07", {
+        "11": [{"rank": "1", "school_name": "가중", "average": "80.0", "special_rate": "3.2%"},
+               {"rank": "2", "school_name": "나중", "average": "70.0", "special_rate": "-"}],
+        "26": [{"rank": "1", "school_name": "다중", "average": "90.0", "special_rate": "1.0%"},
+               {"rank": "2", "school_name": "라중", "average": "80.0", "special_rate": "2.0%"}],
+    })
+    merged = merge_province_csvs(run_dir)
+    assert merged == [os.path.join(run_dir, "achievement_all_3.csv")]
+
+    rows = load_scraped_csv(merged[0])
+    assert [row["school_name"] for row in rows] == ["다중", "가중", "라중", "나중"]
+    assert [row["rank"] for row in rows] == ["1", "2", "2", "4"]
+    assert rows[1]["special_ratio"] == "3.2%"
+    assert "special_rate" not in rows[0]
+
+
+def test_merge_rejects_unknown_metric(tmp_path):
+    write_csv(os.path.join(str(tmp_path), "provinces", "11", "unknown_11_3.csv"),
+              [{"school_name": "가중"}])
+    with pytest.raises(ValueError):
+        merge_province_csvs(str(tmp_path))
+
+
+def test_merge_without_province_files_fails(tmp_path):
+    with pytest.raises(RuntimeError):
+        merge_province_csvs(str(tmp_path))
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+import requests
+
+import update_csv
+from asil_crawler import CrawlStats
+
+
+def write_report(path, started_at, finished_at, records):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"started_at": started_at, "finished_at": finished_at,
+                   "requests": records}, f)
+    return str(path)
+
+
+def test_fetch_school_list_records_connection_errors(monkeypatch):
+    def post(self, url, data=None, **kwargs):
+        raise requests.Timeout("read timed out")
+
+    monkeypatch.setattr(requests.Session, "post", post)
+    stats = CrawlStats()
+    with pytest.raises(requests.Timeout):
+        update_csv.fetch_school_list("11680", "3", "1", "desc", stats=stats)
+
+    [record] = stats.records
+    assert record["area"] == "11680"
+    assert record["status"] is None
+    assert "read timed out" in record["error"]
+    assert stats.summary()["totals"]["errors"] == 1
+
+
+def test_from_reports_derives_timing_from_child_reports(tmp_path):
+    paths = [
+        write_report(tmp_path / "crawl_11.json", "2025-08-07T00:00:10+00:00",
+                     "2025-08-07T00:02:00+00:00", [{"area": "11", "rows": 3}]),
+        write_report(tmp_path / "crawl_26.json", "2025-08-07T00:00:00+00:00",
+                     "2025-08-07T00:01:30+00:00", [{"area": "26", "rows": 2}]),
+    ]
+    report = CrawlStats.from_reports(paths).summary()
+
+    assert report["started_at"] == "2025-08-07T00:00:00+00:00"
+    assert report["finished_at"] == "2025-08-07T00:02:00+00:00"
+    assert report["duration_seconds"] == 120.0
+    assert report["totals"]["rows"] == 5
+    assert sorted(report["areas"]) == ["11", "26"]
+
+
+def test_from_reports_without_timestamps_omits_timing(tmp_path):
+    path = write_report(tmp_path / "crawl_11.json", None, None, [])
+    report = CrawlStats.from_reports([path]).summary()
+    assert report["started_at"] is None
+    assert report["finished_at"] is None
+    assert report["duration_seconds"] is None
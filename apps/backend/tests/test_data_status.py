@@ -0,0 +1,25 @@
+from fastapi.testclient import TestClient
+
+from app import main
+
+client = TestClient(main.app)
+
+
+def test_data_status_reports_sample_fallback(monkeypatch, tmp_path):
+    monkeypatch.setattr(main, "SCHOOL_DATA_PATH", str(tmp_path / "missing.csv"))
+    status = client.get("/data/status").json()
+    assert status["sample"] is True
+    assert status["schools"] == 3
+
+
+def test_data_status_counts_loaded_schools(monkeypatch, tmp_path):
+    path = tmp_path / "schools.csv"
+    path.write_text(
+        "학교명,학업성취도,X좌표(경도),Y좌표(위도)\n"
+        "가중,80.1,127.01,37.50\n나중,75.0,127.02,37.51\n",
+        encoding="utf-8-sig",
+    )
+    monkeypatch.setattr(main, "SCHOOL_DATA_PATH", str(path))
+    assert client.get("/data/status").json() == {
+        "path": str(path), "sample": False, "schools": 2,
+    }
@@ -0,0 +1,114 @@
+import update_csv
+from asil_crawler import ORDER_COLUMNS, AsilCrawler, CrawlStats, compare_orderings, derive_ordering
+
+
+def row(name, average, special_rate, location="서울"):
+    return {"rank": "?", "location": location, "school_name": name,
+            "average": average, "special_rate": special_rate}
+
+
+ROWS = [
+    row("가중", "85.0", "3.0%"),
+    row("나중", "90.5", "-"),
+    row("다중", "85.0", "12.5%"),
+    row("라중", "70.1", "3.0%"),
+    row("마중", "-", "0.0%"),
+]
+
+
+def names(rows):
+    return [r["school_name"] for r in rows]
+
+
+def ranks(rows):
+    return [r["rank"] for r in rows]
+
+
+def test_desc_ordering_shares_ranks_for_ties_and_puts_missing_last():
+    derived = derive_ordering(ROWS, "average", "desc")
+    assert names(derived) == ["나중", "가중", "다중", "라중", "마중"]
+    assert ranks(derived) == ["1", "2", "2", "4", "5"]
+
+
+def test_asc_ordering_parses_percentages():
+    derived = derive_ordering(ROWS, "special_rate", "asc")
+    assert names(derived) == ["마중", "가중", "라중", "다중", "나중"]
+    assert ranks(derived) == ["1", "2", "2", "4", "5"]
+
+
+def test_missing_values_keep_their_original_order():
+    rows = [row("가중", "-", ""), row("나중", "80", ""), row("다중", "", "")]
+    assert names(derive_ordering(rows, "average")) == ["나중", "가중", "다중"]
+
+
+def test_derive_ordering_does_not_modify_input():
+    derive_ordering(ROWS, "average")
+    assert ranks(ROWS) == ["?"] * len(ROWS)
+
+
+def test_compare_orderings_accepts_reordered_ties():
+    derived = derive_ordering(ROWS, "average", "desc")
+    server = [derived[0], derived[2], derived[1], derived[3], derived[4]]
+    assert compare_orderings(derived, server, "average") == []
+
+
+def test_compare_orderings_reports_group_and_rank_mismatches():
+    derived = derive_ordering(ROWS, "average", "desc")
+    server = [dict(r) for r in derived]
+    server[0], server[3] = server[3], server[0]
+    server[0]["rank"], server[3]["rank"] = "1", "4"
+    problems = compare_orderings(derived, server, "average")
+    assert any(p.startswith("group 0") for p in problems)
+    assert any("rank of '나중'" in p for p in problems)
+
+    assert compare_orderings(derived, server[:-1], "average")[0] == "row count 5 != server 4"
+
+
+def test_update_csv_derives_progression_with_its_own_column(monkeypatch):
+    # update_csv 컬럼명(special_ratio)으로 변환해 같은 ORDER_COLUMNS 사용
+    assert ORDER_COLUMNS["7"] == "special_rate"
+    rows = [{"rank": "1", "location": "서울", "school_name": n,
+             "average": a, "special_ratio": s}
+            for n, a, s in (("가중", "90", "1.0%"), ("나중", "80", "9.0%"))]
+    calls = []
+
+    def fetch(area, type1, order, orderby, stats=None):
+        calls.append(order)
+        return rows
+
+    monkeypatch.setattr(update_csv, "fetch_school_list", fetch)
+    results = update_csv.fetch_school_lists("11680", "3", ["1", "7"], "desc")
+    assert calls == ["1"]
+    assert names(results["7"]) == ["나중", "가중"]
+
+    # 검증 시에는 불일치를 기록하고 서버 결과를 반환
+    stats = CrawlStats()
+    results = update_csv.fetch_school_lists("11680", "3", ["1", "7"], "desc",
+                                            stats=stats, verify=True)
+    assert calls == ["1", "1", "7"]
+    assert results["7"] is rows
+    [mismatch] = stats.ordering_mismatches
+    assert mismatch["area"] == "11680" and mismatch["order"] == "7"
+
+
+def test_crawler_verify_keeps_server_rows_and_records_mismatch(tmp_path):
+    crawler = AsilCrawler(stats=CrawlStats())
+    by_average = derive_ordering(ROWS, "average", "desc")
+    # 서버는 동점을 공유 순위가 아닌 연속 순위로 매긴다고 가정
+    server = [dict(r, rank=str(i)) for i, r in
+              enumerate(derive_ordering(ROWS, "special_rate", "desc"), start=1)]
+    pages = {"1": by_average, "7": server}
+    crawler.fetch_school_list = lambda area_code, type1, order, orderby: pages[order]
+
+    results = crawler.fetch_school_lists("11", verify=True)
+    assert results == {"1": by_average, "7": server}
+    [mismatch] = crawler.stats.ordering_mismatches
+    assert mismatch["order"] == "7"
+    assert any("rank of" in p for p in mismatch["problems"])
+
+    # 검증하지 않으면 서버 요청 없이 로컬 정렬 사용
+    assert crawler.fetch_school_lists("11")["7"][0]["rank"] == "1"
+
+    path = str(tmp_path / "crawl_11.json")
+    crawler.stats.write_report(path)
+    assert CrawlStats.from_reports([path]).ordering_mismatches == crawler.stats.ordering_mismatches
@@ -0,0 +1,93 @@
+import unicodedata
+
+from app.geocode_cache import GeocodeCache
+from app.suggest import SuggestIndex, _query_keys, normalize
+
+
+def test_normalize_decomposes_hangul_and_strips_punctuation():
+    assert normalize("래미안 퍼스티지") == normalize("래미안퍼스티지")
+    assert normalize("Raemian-1") == "raemian1"
+    # 완성형 음절은 초성/중성(/종성) 자모로 분해됨
+    assert normalize("램") == "램"
+
+
+def test_normalize_accepts_compatibility_jamo():
+    # 호환 자모 "ㄹ"(U+3139)도 초성 자모로 바뀌어 "래"의 접두사가 됨
+    assert normalize("래").startswith(normalize("ㄹ"))
+    assert unicodedata.name(normalize("ㄹ")) == "HANGUL CHOSEONG RIEUL"
+
+
+def test_query_keys_treats_trailing_jongseong_as_next_choseong():
+    keys = _query_keys("램")
+    assert keys[0] == normalize("램")
+    assert normalize("래미").startswith(keys[1])
+    # 종성이 없으면 키는 하나
+    assert _query_keys("래미") == [normalize("래미")]
+
+
+def test_search_matches_partial_syllables_and_dedupes_spacing():
+    index = SuggestIndex()
+    index.add("래미안퍼스티지", 37.5057, 127.0081)
+    index.add("래미안 퍼스티지", 37.5, 127.0)
+    index.add("반포자이", 37.508, 127.011)
+
+    for query in ("래", "램", "래ㅁ", "래미안 퍼"):
+        assert [s["name"] for s in index.search(query)] == ["래미안퍼스티지"]
+    # 같은 정규화 키는 처음 이름으로 제안되고 좌표만 갱신
+    assert index.search("래미")[0]["latitude"] == 37.5
+    assert index.search("") == []
+    assert len(index) == 2
+
+
+def test_geocode_cache_evicts_least_recently_used():
+    cache = GeocodeCache(max_entries=2)
+    cache.put("a", 1.0, 1.0)
+    cache.put("b", 2.0, 2.0)
+    assert cache.get("a") == (1.0, 1.0)
+    cache.put("c", 3.0, 3.0)
+    assert cache.get("b") is None
+    assert cache.get("a") == (1.0, 1.0)
+
+
+def test_geocode_cache_can_be_disabled():
+    cache = GeocodeCache(max_entries=0)
+    cache.put("a", 1.0, 1.0)
+    assert cache.get("a") is None
+
+
+class FakeResponse:
+    def __init__(self, documents):
+        self._documents = documents
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"documents": self._documents}
+
+
+def test_geocode_indexes_only_apartment_place_names(monkeypatch):
+    from app import main
+
+    documents = {
+        "래미안퍼스티지 아파트 가는길": [{
+            "place_name": "래미안퍼스티지", "category_name": "부동산 > 주거시설 > 아파트",
+            "x": "127.0081", "y": "37.5057",
+        }],
+        "반포한강공원": [{
+            "place_name": "반포한강공원", "category_name": "여행 > 공원",
+            "x": "126.99", "y": "37.51",
+        }],
+    }
+    monkeypatch.setattr(main, "suggest_index", SuggestIndex())
+    monkeypatch.setattr(main, "geocode_cache", GeocodeCache())
+    monkeypatch.setattr(main.requests, "get",
+                        lambda url, headers, params: FakeResponse(documents[params["query"]]))
+
+    assert main.geocode_address("래미안퍼스티지 아파트 가는길") == (37.5057, 127.0081)
+    assert main.geocode_address("반포한강공원") == (37.51, 126.99)
+
+    assert [s["name"] for s in main.suggest_index.search("래미")] == ["래미안퍼스티지"]
+    assert main.suggest_index.search("반포") == []
+    # 검색어 원문은 제안이 아닌 지오코딩 캐시에만 저장
+    assert main.geocode_cache.get("반포한강공원") == (37.51, 126.99)
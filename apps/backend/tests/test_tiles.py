@@ -0,0 +1,56 @@
+import json
+
+import pandas as pd
+
+from app.tiles import TileIndex, bbox_tile_count, bbox_tiles, latlon_to_tile
+
+
+def schools(*rows):
+    return pd.DataFrame(rows, columns=["학교명", "latitude", "longitude", "performance_score"])
+
+
+def test_latlon_to_tile_known_values():
+    assert latlon_to_tile(0.0, 0.0, zoom=1) == (1, 1)
+    assert latlon_to_tile(85.0, -180.0, zoom=1) == (0, 0)
+    # 서울시청 (줌 13)
+    assert latlon_to_tile(37.5665, 126.9780) == (6985, 3172)
+
+
+def test_latlon_to_tile_clamps_out_of_range():
+    n = 2 ** 13
+    assert latlon_to_tile(90.0, 180.0) == (n - 1, 0)
+    assert latlon_to_tile(-90.0, -180.0) == (0, n - 1)
+
+
+def test_bbox_tiles_cover_corners_and_match_count():
+    box = (37.49, 127.01, 37.52, 127.06)
+    tiles = set(bbox_tiles(*box))
+    assert len(tiles) == bbox_tile_count(*box)
+    for lat in (box[0], box[2]):
+        for lon in (box[1], box[3]):
+            assert latlon_to_tile(lat, lon) in tiles
+
+
+def test_bbox_filters_schools_inside_covering_tiles():
+    index = TileIndex(schools(
+        ("안", 37.50, 127.02, 80.0),
+        ("밖", 37.53, 127.02, 90.0),     # 같은 타일 범위 근처지만 bbox 밖
+        ("먼", 35.18, 129.08, 70.0),
+    ), snapshot="test")
+    names = [s["학교명"] for s in index.bbox(37.49, 127.01, 37.52, 127.06)]
+    assert names == ["안"]
+
+
+def test_tile_etag_depends_only_on_tile_content():
+    a = TileIndex(schools(("가", 37.50, 127.02, 80.0), ("나", 35.18, 129.08, 70.0)), "a")
+    b = TileIndex(schools(("가", 37.50, 127.02, 80.0), ("나", 35.18, 129.08, 71.0)), "b")
+    seoul = latlon_to_tile(37.50, 127.02)
+    busan = latlon_to_tile(35.18, 129.08)
+    assert a.tile(*seoul)[1] == b.tile(*seoul)[1]
+    assert a.tile(*busan)[1] != b.tile(*busan)[1]
+
+
+def test_empty_tile_returns_empty_list():
+    body, etag = TileIndex(schools(), "empty").tile(1, 2)
+    assert json.loads(body) == {"z": 13, "x": 1, "y": 2, "schools": []}
+    assert etag.startswith('"') and etag.endswith('"')
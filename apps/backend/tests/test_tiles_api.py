@@ -0,0 +1,77 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.tiles import latlon_to_tile
+
+client = TestClient(main.app)
+
+HEADER = "학교명,학업성취도,X좌표(경도),Y좌표(위도)\n"
+BBOX = {"min_lat": 37.49, "min_lon": 127.01, "max_lat": 37.52, "max_lon": 127.06}
+
+
+@pytest.fixture
+def school_csv(monkeypatch, tmp_path):
+    path = tmp_path / "schools.csv"
+    path.write_text(HEADER + "가중,80.1,127.02,37.50\n나중,75.0,127.05,37.51\n",
+                    encoding="utf-8-sig")
+    monkeypatch.setattr(main, "SCHOOL_DATA_PATH", str(path))
+    return path
+
+
+def tile_url(lat, lon):
+    x, y = latlon_to_tile(lat, lon)
+    return f"/tiles/13/{x}/{y}"
+
+
+def test_tile_returns_etag_and_304_on_match(school_csv):
+    res = client.get(tile_url(37.50, 127.02))
+    assert res.status_code == 200
+    assert "가중" in [s["학교명"] for s in res.json()["schools"]]
+    etag = res.headers["ETag"]
+
+    cached = client.get(tile_url(37.50, 127.02), headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert client.get(tile_url(37.50, 127.02),
+                      headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_tile_rejects_other_zoom_and_out_of_range(school_csv):
+    assert client.get("/tiles/12/0/0").status_code == 404
+    assert client.get(f"/tiles/13/{2 ** 13}/0").status_code == 404
+
+
+def test_bbox_returns_etag_and_304_on_match(school_csv):
+    res = client.get("/schools/bbox", params=BBOX)
+    assert res.status_code == 200
+    assert sorted(s["학교명"] for s in res.json()["schools"]) == ["가중", "나중"]
+
+    cached = client.get("/schools/bbox", params=BBOX,
+                        headers={"If-None-Match": res.headers["ETag"]})
+    assert cached.status_code == 304
+
+
+def test_bbox_rejects_inverted_and_too_large_boxes(school_csv):
+    inverted = dict(BBOX, min_lat=BBOX["max_lat"], max_lat=BBOX["min_lat"])
+    assert client.get("/schools/bbox", params=inverted).status_code == 400
+    too_large = {"min_lat": 33.0, "min_lon": 124.0, "max_lat": 38.6, "max_lon": 131.0}
+    assert client.get("/schools/bbox", params=too_large).status_code == 400
+
+
+def test_index_rebuilds_when_school_data_changes(school_csv, monkeypatch, tmp_path):
+    first = client.get("/schools/bbox", params=BBOX)
+
+    other = tmp_path / "other.csv"
+    other.write_text(HEADER + "다중,90.0,127.03,37.50\n", encoding="utf-8-sig")
+    monkeypatch.setattr(main, "SCHOOL_DATA_PATH", str(other))
+    second = client.get("/schools/bbox", params=BBOX,
+                        headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 200
+    assert [s["학교명"] for s in second.json()["schools"]] == ["다중"]
+    assert second.headers["X-Data-Snapshot"] != first.headers["X-Data-Snapshot"]
+
+
+def test_missing_data_is_reported_as_sample_snapshot(monkeypatch, tmp_path):
+    monkeypatch.setattr(main, "SCHOOL_DATA_PATH", str(tmp_path / "missing.csv"))
+    assert client.get(tile_url(37.5665, 126.9780)).headers["X-Data-Snapshot"] == "sample"
@@ -0,0 +1,89 @@
+import asyncio
+import math
+import time
+
+import pytest
+
+from app.main import haversine
+from app.workpool import AdmissionPool, PoolOverloaded
+
+
+def test_admit_limits_in_flight_requests_and_releases_on_exit():
+    pool = AdmissionPool(workers=1, max_queue=1, max_inflight=2)
+    try:
+        with pool.admit(), pool.admit():
+            with pytest.raises(PoolOverloaded) as err:
+                with pool.admit():
+                    pass
+            assert err.value.retry_after >= 1
+            assert pool.stats()["rejected_total"] == 1
+            assert pool.stats()["in_flight"] == 2
+        # 예외로 빠져나와도 자리가 반납됨
+        with pytest.raises(ValueError):
+            with pool.admit():
+                raise ValueError
+        with pool.admit():
+            pass
+        assert pool.stats()["in_flight"] == 0
+    finally:
+        pool.shutdown()
+
+
+def test_io_waits_do_not_occupy_worker_slots():
+    pool = AdmissionPool(workers=1, max_queue=0, max_inflight=8)
+    results, snapshots = [], []
+
+    async def handler(delay):
+        with pool.admit():
+            # 지오코딩(I/O) 대기 중에는 워커 풀 자리를 차지하지 않음
+            await asyncio.sleep(delay)
+            results.append(await pool.run(lambda: "ok"))
+
+    async def main():
+        tasks = [asyncio.ensure_future(handler(0.05 * (i + 1))) for i in range(4)]
+        await asyncio.sleep(0.01)
+        snapshots.append(pool.stats())
+        await asyncio.gather(*tasks)
+
+    try:
+        asyncio.run(main())
+    finally:
+        pool.shutdown()
+    assert results == ["ok"] * 4
+    assert snapshots[0]["in_flight"] == 4
+    assert snapshots[0]["queued"] == 0
+
+
+def test_run_rejects_when_workers_and_queue_are_full():
+    pool = AdmissionPool(workers=1, max_queue=0)
+    results = []
+
+    async def handler():
+        try:
+            with pool.admit():
+                results.append(await pool.run(time.sleep, 0.1) or "ok")
+        except PoolOverloaded:
+            results.append("rejected")
+
+    async def main():
+        await asyncio.gather(handler(), handler())
+
+    try:
+        asyncio.run(main())
+    finally:
+        pool.shutdown()
+    assert sorted(results) == ["ok", "rejected"]
+    assert pool.stats()["completed_total"] == 1
+
+
+def test_vectorized_haversine_matches_scalar():
+    import pandas as pd
+
+    lats = pd.Series([37.5665, 37.5057, 35.1796])
+    lons = pd.Series([126.9780, 127.0081, 129.0756])
+    distances = haversine(37.5665, 126.9780, lats, lons)
+    assert distances.iloc[0] == 0
+    for lat, lon, dist in zip(lats, lons, distances):
+        assert math.isclose(float(haversine(37.5665, 126.9780, lat, lon)), dist)
+    # 서울시청 - 부산시청 약 325km
+    assert 320 < distances.iloc[2] < 330
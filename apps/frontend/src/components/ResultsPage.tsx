@@ -1,5 +1,5 @@
 import { useState, useEffect } from "react";
-import { useParams, useNavigate } from "react-router-dom";
+import { useParams, useNavigate, useSearchParams } from "react-router-dom";
 import { Button } from "./ui/button";
 import {
   Card,
@@ -34,6 +34,9 @@ interface ApiResponse {
 
 const ResultsPage = () => {
   const { apartmentName } = useParams<{ apartmentName: string }>();
+  const [searchParams] = useSearchParams();
+  const lat = searchParams.get("lat");
+  const lon = searchParams.get("lon");
   const navigate = useNavigate();
   const [data, setData] = useState<ApiResponse | null>(null);
   const [loading, setLoading] = useState(true);
@@ -52,7 +55,10 @@ const ResultsPage = () => {
             import.meta.env.VITE_API_URL
           }/search-schools?apartment=${encodeURIComponent(
             apartmentName
-          )}&sort_by=distance&radius=3.0`
+          )}&sort_by=distance&radius=3.0${
+            // 자동완성으로 선택한 경우 좌표를 넘겨 지오코딩 생략
+            lat && lon ? `&lat=${lat}&lon=${lon}` : ""
+          }`
         );
 
         if (!response.ok) {
@@ -72,7 +78,7 @@ const ResultsPage = () => {
     };
 
     fetchData();
-  }, [apartmentName]);
+  }, [apartmentName, lat, lon]);
 
   const handleBack = () => {
     navigate("/");
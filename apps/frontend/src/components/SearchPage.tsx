@@ -1,4 +1,4 @@
-import { useState } from "react";
+import { useEffect, useState } from "react";
 import { useNavigate } from "react-router-dom";
 import {
   Card,
@@ -11,10 +11,48 @@ import { Button } from "./ui/button";
 import { Input } from "./ui/input";
 import { Search, School, MapPin } from "lucide-react";
 
+// 자동완성 응답 타입
+interface Suggestion {
+  name: string;
+  latitude: number;
+  longitude: number;
+}
+
 const SearchPage = () => {
   const [apartmentName, setApartmentName] = useState("");
+  const [suggestions, setSuggestions] = useState<Suggestion[]>([]);
   const navigate = useNavigate();
 
+  // 입력이 멈추면 이미 검색된 아파트명 중에서 자동완성 후보 조회
+  useEffect(() => {
+    const query = apartmentName.trim();
+    if (!query) {
+      setSuggestions([]);
+      return;
+    }
+    const controller = new AbortController();
+    const timer = setTimeout(async () => {
+      try {
+        const response = await fetch(
+          `${import.meta.env.VITE_API_URL}/suggest?q=${encodeURIComponent(
+            query
+          )}&limit=8`,
+          { signal: controller.signal }
+        );
+        if (response.ok) {
+          const result = await response.json();
+          setSuggestions(result.suggestions);
+        }
+      } catch {
+        // 자동완성 실패는 검색에 영향을 주지 않음
+      }
+    }, 150);
+    return () => {
+      clearTimeout(timer);
+      controller.abort();
+    };
+  }, [apartmentName]);
+
   const handleSubmit = (e: React.FormEvent) => {
     e.preventDefault();
     if (apartmentName.trim()) {
@@ -22,6 +60,15 @@ const SearchPage = () => {
     }
   };
 
+  // 자동완성 선택 시 좌표를 함께 넘겨 지오코딩 생략
+  const handleSelect = (suggestion: Suggestion) => {
+    navigate(
+      `/results/${encodeURIComponent(suggestion.name)}?lat=${
+        suggestion.latitude
+      }&lon=${suggestion.longitude}`
+    );
+  };
+
   return (
     <div className="min-h-screen bg-gradient-to-br from-background to-muted flex items-center justify-center p-4">
       <div className="w-full max-w-2xl space-y-8">
@@ -61,6 +108,22 @@ const SearchPage = () => {
                   className="pl-10 h-12 text-lg"
                 />
                 <Search className="absolute left-3 top-3.5 h-5 w-5 text-muted-foreground" />
+                {suggestions.length > 0 && (
+                  <ul className="absolute z-10 mt-1 w-full rounded-md border bg-background shadow-md">
+                    {suggestions.map((suggestion) => (
+                      <li key={suggestion.name}>
+                        <button
+                          type="button"
+                          onClick={() => handleSelect(suggestion)}
+                          className="flex w-full items-center gap-2 px-3 py-2 text-left hover:bg-muted"
+                        >
+                          <MapPin className="h-4 w-4 text-muted-foreground" />
+                          {suggestion.name}
+                        </button>
+                      </li>
+                    ))}
+                  </ul>
+                )}
               </div>
               <Button
                 type="submit"